@@ -5,12 +5,105 @@ Handles network issues and provides progress tracking
 
 import sys
 import os
+import csv
+import importlib.util
 from pathlib import Path
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Import names of the packages the ML module needs (faster_whisper is optional)
+REQUIRED_PACKAGES = [
+    "pandas", "numpy", "sklearn", "torch", "transformers",
+    "sentence_transformers", "spacy"
+]
+OPTIONAL_PACKAGES = ["faster_whisper", "pyarrow", "faiss", "model2vec", "orjson"]
+
+# Dataset files the pipeline loads, with the columns it reads from each
+REQUIRED_DATASETS = {
+    "skill_taxonomy.csv": {"skill_id", "skill_name", "category"},
+    "job_listings.csv": {"job_id", "job_title", "category", "required_skills", "location"},
+    "learning_resources.csv": {"resource_id", "title", "skill_covered", "category"},
+}
+
+
+def check_datasets(datasets_dir: str = "datasets"):
+    """
+    Check dataset CSVs with one stat() and a header read each
+    
+    Catches missing files, 0-byte files left by an interrupted
+    generate_datasets.py run, and missing columns, without loading pandas.
+    
+    Args:
+        datasets_dir: Folder holding the generated CSVs
+        
+    Returns:
+        True if every dataset exists, is non-empty and has its columns
+    """
+    print("\n" + "="*70)
+    print("📊 Checking Datasets")
+    print("="*70)
+    
+    ok = True
+    for name, columns in REQUIRED_DATASETS.items():
+        path = Path(datasets_dir) / name
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            print(f"  ✗ {name}: missing")
+            ok = False
+            continue
+        
+        if size == 0:
+            print(f"  ⚠ {name}: empty (re-run generate_datasets.py)")
+            ok = False
+            continue
+        
+        with open(path, newline='', encoding='utf-8') as f:
+            header = set(next(csv.reader(f), []))
+        missing = columns - header
+        if missing:
+            print(f"  ⚠ {name}: missing columns {', '.join(sorted(missing))}")
+            ok = False
+        else:
+            print(f"  ✓ {name} ({size / 1024:.0f} KB)")
+    
+    if not ok:
+        print("\n  Run: python generate_datasets.py")
+    return ok
+
+
+def check_dependencies():
+    """
+    Check that required packages are installed, without importing them
+    
+    Uses importlib.util.find_spec, so torch/transformers are never
+    initialized and the check finishes in well under a second.
+    
+    Returns:
+        True if every required package is installed
+    """
+    print("\n" + "="*70)
+    print("📦 Checking Installed Packages")
+    print("="*70)
+    
+    missing = [m for m in REQUIRED_PACKAGES if importlib.util.find_spec(m) is None]
+    for name in REQUIRED_PACKAGES:
+        print(f"  {'✗' if name in missing else '✓'} {name}")
+    
+    for name in OPTIONAL_PACKAGES:
+        found = importlib.util.find_spec(name) is not None
+        print(f"  {'✓' if found else '⚠'} {name} (optional)")
+    
+    if missing:
+        print(f"\n✗ Missing: {', '.join(missing)}")
+        print("  Run: pip install -r requirements.txt")
+        return False
+    
+    print("\n✓ Dependencies OK")
+    return True
+
 
 def download_spacy_model():
     """Download spaCy English model"""
@@ -108,18 +201,18 @@ def download_whisper(model_size="base"):
     print(f"Selected: {model_size} - {model_sizes.get(model_size, 'unknown')}")
     
     try:
-        import whisper
+        from faster_whisper import WhisperModel
         
         print(f"\n⏳ Downloading Whisper {model_size} model...")
-        model = whisper.load_model(model_size)
+        model = WhisperModel(model_size, device="cpu", compute_type="int8")
         
         print(f"✓ Whisper {model_size} model downloaded successfully!")
         
         return True
     
     except ImportError:
-        print("✗ openai-whisper not installed")
-        print("  Run: pip install openai-whisper")
+        print("✗ faster-whisper not installed")
+        print("  Run: pip install faster-whisper")
         return False
     except Exception as e:
         print(f"✗ Error: {e}")
@@ -157,8 +250,8 @@ def verify_installations():
     
     # Check Whisper (optional)
     try:
-        import whisper
-        model = whisper.load_model("base")
+        from faster_whisper import WhisperModel
+        model = WhisperModel("base", device="cpu", compute_type="int8")
         print("✓ Whisper: Working")
         results['whisper'] = True
     except:
@@ -251,5 +344,10 @@ def main():
 
 
 if __name__ == "__main__":
+    if "--check" in sys.argv:
+        deps_ok = check_dependencies()
+        data_ok = check_datasets()
+        sys.exit(0 if deps_ok and data_ok else 1)
+    
     success = main()
     sys.exit(0 if success else 1)
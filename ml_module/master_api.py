@@ -34,6 +34,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pipeline log level (skillsync.* loggers), e.g. SKILLSYNC_LOG=DEBUG
+_log_level = os.getenv("SKILLSYNC_LOG", "INFO").upper()
+if isinstance(logging.getLevelName(_log_level), int):
+    logging.getLogger("skillsync").setLevel(_log_level)
+else:
+    logger.warning(f"Ignoring unknown SKILLSYNC_LOG level: {_log_level}")
+
 # ============================================================================
 # Pydantic Models for API
 # ============================================================================
@@ -453,7 +460,7 @@ def save_models_task(pipeline):
         logger.info("Saving models...")
         
         # Save skill embeddings
-        pipeline.skill_normalizer.save_embeddings("models/skill_embeddings.pkl")
+        pipeline.skill_normalizer.save_embeddings("models/skill_embeddings.safetensors")
         
         # Save job recommender
         pipeline.job_recommender.save_model("models/job_recommender.pkl")
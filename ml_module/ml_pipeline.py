@@ -6,11 +6,15 @@ Primary Input: Voice/Audio → Text → Skills → Jobs
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 from pathlib import Path
+import json
 import time
 import logging
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("skillsync.pipeline")
+
 # Import custom modules
 try:
     from skill_extraction_multilingual import MultilingualSkillExtractor as SkillExtractor
@@ -29,11 +33,21 @@ try:
     AUDIO_AVAILABLE = True
 except ImportError:
     AUDIO_AVAILABLE = False
-    logger = logging.getLogger(__name__)
-    logger.warning("Audio processor not available. Install: pip install openai-whisper")
+    logger.warning("Audio processor not available. Install: pip install faster-whisper")
+
+# Committed words carried over as context when extracting from a new suffix
+_COMMIT_CONTEXT_WORDS = 3
+
+
+def _longest_common_prefix(prev_tokens: List[str], curr_tokens: List[str]) -> List[str]:
+    """Return the tokens two consecutive transcript snapshots agree on"""
+    n = 0
+    for a, b in zip(prev_tokens, curr_tokens):
+        if a != b:
+            break
+        n += 1
+    return curr_tokens[:n]
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
 
 class SkillSyncPipeline:
     """Complete ML pipeline for SkillSync"""
@@ -43,62 +57,77 @@ class SkillSyncPipeline:
         use_whisper: bool = False,
         skill_taxonomy_path: str = "datasets/skill_taxonomy.csv",
         job_listings_path: str = "datasets/job_listings.csv",
-        learning_resources_path: str = "datasets/learning_resources.csv"
+        learning_resources_path: str = "datasets/learning_resources.csv",
+        audio_processor: Optional["AudioProcessor"] = None,
+        extractor: Optional[SkillExtractor] = None,
+        normalizer: Optional[SkillNormalizer] = None,
+        recommender: Optional[JobRecommender] = None
     ):
         """
         Initialize the complete ML pipeline
         
+        Already-loaded components can be passed in to share them between
+        pipelines (models and taxonomy embeddings are then loaded once).
+        
         Args:
             use_whisper: Enable speech-to-text (requires audio input)
             skill_taxonomy_path: Path to skill taxonomy
             job_listings_path: Path to job listings
             learning_resources_path: Path to learning resources
+            audio_processor: Existing AudioProcessor to reuse
+            extractor: Existing skill extractor to reuse
+            normalizer: Existing SkillNormalizer to reuse
+            recommender: Existing JobRecommender to reuse
         """
-        print("=" * 70)
-        print("SkillSync ML Pipeline - Initialization")
-        print("=" * 70)
+        logger.info("=" * 70)
+        logger.info("SkillSync ML Pipeline - Initialization")
+        logger.info("=" * 70)
         
         self.use_whisper = use_whisper
         
         # Initialize Speech-to-Text (Voice-First)
-        self.audio_processor = None
-        if use_whisper and AUDIO_AVAILABLE:
-            try:
-                print("\n[1/5] Initializing Audio Processor (Whisper)...")
-                self.audio_processor = AudioProcessor(model_size="base")
-                print("✓ Audio processor ready")
-            except Exception as e:
-                print(f"⚠ Audio processor failed: {e}")
-                print("  Install with: pip install openai-whisper")
-        elif use_whisper:
-            print("⚠ Audio processing not available.")
-            print("  Install: pip install openai-whisper ffmpeg-python pydub")
+        self.audio_processor = audio_processor
+        if use_whisper and audio_processor is None:
+            if AUDIO_AVAILABLE:
+                try:
+                    logger.info("[1/5] Initializing Audio Processor (Whisper)...")
+                    self.audio_processor = AudioProcessor(model_size="base")
+                    logger.info("✓ Audio processor ready")
+                except Exception as e:
+                    logger.warning("⚠ Audio processor failed: %s", e)
+                    logger.warning("  Install with: pip install faster-whisper")
+            else:
+                logger.warning("⚠ Audio processing not available.")
+                logger.warning("  Install: pip install faster-whisper ffmpeg-python pydub")
         
         # Initialize Skill Extraction (Multilingual)
-        print(f"\n[{2 if use_whisper else 1}/4] Initializing Skill Extractor (Multilingual)...")
-        try:
-            self.skill_extractor = SkillExtractor(skill_taxonomy_path=skill_taxonomy_path)
-        except TypeError:
-            # For MultilingualSkillExtractor which may have different signature
-            self.skill_extractor = SkillExtractor()
-        print("✓ Skill Extractor initialized")
+        logger.info("[%d/4] Initializing Skill Extractor (Multilingual)...", 2 if use_whisper else 1)
+        if extractor is not None:
+            self.skill_extractor = extractor
+        else:
+            try:
+                self.skill_extractor = SkillExtractor(skill_taxonomy_path=skill_taxonomy_path)
+            except TypeError:
+                # For MultilingualSkillExtractor which may have different signature
+                self.skill_extractor = SkillExtractor()
+        logger.info("✓ Skill Extractor initialized")
         
         # Initialize Skill Normalization
-        print(f"\n[{3 if use_whisper else 2}/4] Initializing Skill Normalizer...")
-        self.skill_normalizer = SkillNormalizer(
+        logger.info("[%d/4] Initializing Skill Normalizer...", 3 if use_whisper else 2)
+        self.skill_normalizer = normalizer or SkillNormalizer(
             skill_taxonomy_path=skill_taxonomy_path
         )
         
         # Initialize Job Recommender
-        print(f"\n[{4 if use_whisper else 3}/4] Initializing Job Recommender...")
-        self.job_recommender = JobRecommender(
+        logger.info("[%d/4] Initializing Job Recommender...", 4 if use_whisper else 3)
+        self.job_recommender = recommender or JobRecommender(
             job_listings_path=job_listings_path,
             learning_resources_path=learning_resources_path
         )
         
-        print("\n" + "=" * 70)
-        print("✓ SkillSync Pipeline Ready!")
-        print("=" * 70)
+        logger.info("=" * 70)
+        logger.info("✓ SkillSync Pipeline Ready!")
+        logger.info("=" * 70)
     
     def transcribe_audio(self, audio_path: Union[str, Path], **kwargs) -> Dict:
         """
@@ -114,72 +143,178 @@ class SkillSyncPipeline:
         if not self.audio_processor:
             raise Exception("Audio processor not initialized. Set use_whisper=True")
         
-        logger.info(f"🎤 Transcribing audio: {Path(audio_path).name}")
+        logger.debug("🎤 Transcribing audio: %s", Path(audio_path).name)
         result = self.audio_processor.transcribe_audio(audio_path, **kwargs)
         
         if result['success']:
-            logger.info(f"✓ Transcription complete: {result['text'][:100]}...")
+            logger.debug("✓ Transcription complete: %.100s...", result['text'])
         else:
-            logger.error(f"✗ Transcription failed: {result.get('error', 'Unknown error')}")
+            logger.error("✗ Transcription failed: %s", result.get('error', 'Unknown error'))
         
         return result
     
-    def process_text_input(self, text: str) -> Dict:
+    def batch_transcribe(
+        self,
+        audio_paths: List[Union[str, Path]],
+        **kwargs
+    ) -> List[Dict]:
+        """
+        Convert several audio files to text with batched Whisper inference
+        
+        Args:
+            audio_paths: List of audio file paths
+            **kwargs: Additional transcription parameters
+            
+        Returns:
+            List of transcription results, in input order
+        """
+        if not self.audio_processor:
+            raise Exception("Audio processor not initialized. Set use_whisper=True")
+        
+        logger.debug("🎤 Batch transcribing %d audio files", len(audio_paths))
+        return self.audio_processor.batch_transcribe(audio_paths, **kwargs)
+    
+    def process_text_input(
+        self,
+        text: str,
+        extraction_result: Optional[Dict] = None
+    ) -> Dict:
         """
         Process text input through the complete pipeline
         
         Args:
             text: Worker utterance (text)
+            extraction_result: Pre-computed extraction (skips step 1 if given)
             
         Returns:
             Complete profile with skills, jobs, and learning recommendations
         """
         start_time = time.time()
         
-        print("\n" + "=" * 70)
-        print("Processing Worker Input")
-        print("=" * 70)
-        print(f"\nInput: {text}")
+        logger.debug("Processing worker input: %s", text)
         
         # Step 1: Extract skills from text
-        print("\n[Step 1/3] Extracting skills...")
-        extraction_result = self.skill_extractor.extract_from_utterance(text)
+        logger.debug("[Step 1/3] Extracting skills...")
+        if extraction_result is None:
+            extraction_result = self.skill_extractor.extract_from_utterance(text)
         
         raw_skills = [s['skill'] for s in extraction_result['skills']]
-        print(f"✓ Extracted {len(raw_skills)} skills: {', '.join(raw_skills[:5])}")
+        logger.debug("✓ Extracted %d skills: %s", len(raw_skills), raw_skills[:5])
         
         # Step 2: Normalize skills
-        print("\n[Step 2/3] Normalizing skills...")
-        normalized_skills = []
-        
-        for raw_skill in raw_skills:
-            matches = self.skill_normalizer.normalize_skill(
-                raw_skill, 
-                threshold=0.5, 
+        logger.debug("[Step 2/3] Normalizing skills...")
+        normalized_skills = [
+            matches[0]
+            for matches in self.skill_normalizer.normalize_skills_batch(
+                raw_skills,
+                threshold=0.5,
                 top_k=1
             )
-            if matches:
-                normalized_skills.append(matches[0])
+            if matches
+        ]
+        
+        profile = self._build_profile(text, extraction_result, raw_skills, normalized_skills, start_time)
+        
+        logger.debug("✓ Profile created in %ss", profile['processing_time'])
+        
+        return profile
+    
+    def process_text_batch(
+        self,
+        texts: List[str],
+        extraction_results: Optional[List[Dict]] = None
+    ) -> List[Dict]:
+        """
+        Process several texts, normalizing all their skills in one batch
+        
+        Same profiles as process_text_input, but the skills of every text
+        go through a single encode call and similarity matmul.
+        
+        Args:
+            texts: Worker utterances
+            extraction_results: Pre-computed extractions, one per text
+                (skips step 1 if given)
+            
+        Returns:
+            One profile per text, in input order. processing_time counts
+            from the start of the batch
+        """
+        start_time = time.time()
         
+        logger.debug("Processing %d worker inputs in one batch", len(texts))
+        
+        # Step 1: Extract skills from each text
+        if extraction_results is None:
+            extraction_results = [self.skill_extractor.extract_from_utterance(t) for t in texts]
+        
+        raw_skills = [[s['skill'] for s in r['skills']] for r in extraction_results]
+        
+        # Step 2: Normalize every text's skills together, then split back
+        all_matches = self.skill_normalizer.normalize_skills_batch(
+            [skill for skills in raw_skills for skill in skills],
+            threshold=0.5,
+            top_k=1
+        )
+        
+        profiles = []
+        offset = 0
+        for text, extraction_result, skills in zip(texts, extraction_results, raw_skills):
+            normalized_skills = [
+                matches[0]
+                for matches in all_matches[offset:offset + len(skills)]
+                if matches
+            ]
+            offset += len(skills)
+            
+            # Step 3: Recommendations for this text
+            profiles.append(self._build_profile(
+                text, extraction_result, skills, normalized_skills, start_time
+            ))
+        
+        logger.debug("✓ %d profiles created in %.2fs", len(profiles), time.time() - start_time)
+        
+        return profiles
+    
+    def _build_profile(
+        self,
+        text: str,
+        extraction_result: Dict,
+        raw_skills: List[str],
+        normalized_skills: List[Dict],
+        start_time: float
+    ) -> Dict:
+        """
+        Generate recommendations and compile the profile for one text
+        
+        Args:
+            text: Worker utterance
+            extraction_result: Skill extraction for text
+            raw_skills: Extracted skill names
+            normalized_skills: Best taxonomy match of each normalized skill
+            start_time: time.time() when processing started
+            
+        Returns:
+            Complete profile with skills, jobs, and learning recommendations
+        """
         unique_normalized = list({s['normalized_skill'] for s in normalized_skills})
-        print(f"✓ Normalized to {len(unique_normalized)} standard skills")
+        logger.debug("✓ Normalized to %d standard skills", len(unique_normalized))
         
         # Step 3: Generate recommendations
-        print("\n[Step 3/3] Generating recommendations...")
+        logger.debug("[Step 3/3] Generating recommendations...")
         
         # Job recommendations
         job_recommendations = self.job_recommender.recommend_jobs(
             worker_skills=unique_normalized,
             top_k=10
         )
-        print(f"✓ Found {len(job_recommendations)} job matches")
+        logger.debug("✓ Found %d job matches", len(job_recommendations))
         
         # Learning recommendations
         learning_recommendations = self.job_recommender.recommend_learning(
             worker_skills=unique_normalized,
             top_k=5
         )
-        print(f"✓ Found {len(learning_recommendations)} learning resources")
+        logger.debug("✓ Found %d learning resources", len(learning_recommendations))
         
         # Compile complete profile
         profile = {
@@ -197,11 +332,15 @@ class SkillSyncPipeline:
             'skill_details': normalized_skills
         }
         
-        print(f"\n✓ Profile created in {profile['processing_time']}s")
-        
         return profile
     
-    def process_audio_input(self, audio_path: Union[str, Path], **kwargs) -> Dict:
+    def process_audio_input(
+        self,
+        audio_path: Union[str, Path],
+        stream: Optional[bool] = None,
+        on_partial: Optional[Callable[[Dict], None]] = None,
+        **kwargs
+    ) -> Dict:
         """
         Process audio input through complete pipeline (Voice-First Main Entry Point)
         
@@ -210,6 +349,10 @@ class SkillSyncPipeline:
         
         Args:
             audio_path: Path to audio file (mp3, wav, m4a, ogg, etc.)
+            stream: Extract skills incrementally from partial transcripts
+                (default: only when on_partial is given, since streaming
+                re-decodes audio each round)
+            on_partial: Called with committed text and skills after each round
             **kwargs: Additional transcription parameters
             
         Returns:
@@ -219,10 +362,20 @@ class SkillSyncPipeline:
             - job_recommendations
             - learning_recommendations
         """
-        logger.info(f"🎙️ Voice-First Processing: {Path(audio_path).name}")
-        
-        # Step 1: Transcribe audio to text
-        transcription_result = self.transcribe_audio(audio_path, **kwargs)
+        logger.debug("🎙️ Voice-First Processing: %s", Path(audio_path).name)
+        
+        # Step 1: Transcribe audio to text (extracting skills as words commit)
+        extraction_result = None
+        if stream is None:
+            stream = on_partial is not None
+        if stream:
+            if not self.audio_processor:
+                raise Exception("Audio processor not initialized. Set use_whisper=True")
+            transcription_result, extraction_result = self._stream_transcribe_and_extract(
+                audio_path, on_partial, **kwargs
+            )
+        else:
+            transcription_result = self.transcribe_audio(audio_path, **kwargs)
         
         if not transcription_result['success']:
             return {
@@ -234,7 +387,7 @@ class SkillSyncPipeline:
         text = transcription_result['text']
         
         # Step 2: Process the transcribed text
-        processing_result = self.process_text_input(text)
+        processing_result = self.process_text_input(text, extraction_result)
         
         # Step 3: Combine results
         processing_result['transcription'] = {
@@ -246,10 +399,90 @@ class SkillSyncPipeline:
         processing_result['audio_file'] = str(audio_path)
         processing_result['success'] = True
         
-        logger.info(f"✓ Voice processing complete")
+        logger.debug("✓ Voice processing complete")
         
         return processing_result
     
+    def _stream_transcribe_and_extract(
+        self,
+        audio_path: Union[str, Path],
+        on_partial: Optional[Callable[[Dict], None]] = None,
+        **kwargs
+    ):
+        """
+        Stream transcription and extract skills from committed text (LocalAgreement-2)
+        
+        Words are committed once two consecutive transcript snapshots agree on
+        them (longest common prefix); only the newly-committed suffix is fed
+        through skill extraction, so skills surface via `on_partial` before
+        the audio ends.
+        
+        Args:
+            audio_path: Path to audio file
+            on_partial: Called with committed text and skills after each round
+            **kwargs: Additional transcription parameters
+            
+        Returns:
+            Tuple of (final transcription result, extraction result)
+        """
+        prev_tokens: List[str] = []
+        committed: List[str] = []
+        skills: List[Dict] = []
+        seen_skills = set()
+        transcription_result = {'success': False, 'text': ''}
+        
+        try:
+            for snapshot in self.audio_processor.transcribe_stream(audio_path, **kwargs):
+                transcription_result = snapshot
+                curr_tokens = snapshot['text'].split()
+                
+                if snapshot['final']:
+                    # End of audio: the last snapshot is authoritative
+                    agreed = curr_tokens
+                else:
+                    agreed = _longest_common_prefix(prev_tokens, curr_tokens)
+                prev_tokens = curr_tokens
+                
+                # Only extend the commit mid-stream; never retract committed words
+                keep = len(_longest_common_prefix(committed, agreed))
+                new_words = agreed[keep:]
+                if not snapshot['final'] and (keep < len(committed) or not new_words):
+                    continue
+                
+                # Keep a few committed words as context for multi-word keywords
+                context = agreed[max(0, keep - _COMMIT_CONTEXT_WORDS):keep]
+                committed = agreed
+                
+                if new_words:
+                    partial = self.skill_extractor.extract_from_utterance(
+                        " ".join(context + new_words)
+                    )
+                    for skill in partial['skills']:
+                        if skill['skill'] not in seen_skills:
+                            seen_skills.add(skill['skill'])
+                            skills.append(skill)
+                
+                if on_partial:
+                    on_partial({
+                        'committed_text': " ".join(committed),
+                        'skills': [s['skill'] for s in skills],
+                        'final': snapshot['final']
+                    })
+        except Exception as e:
+            logger.error("✗ Streaming transcription failed: %s", e)
+            return {'success': False, 'text': '', 'error': str(e)}, None
+        
+        if not transcription_result['success']:
+            return transcription_result, None
+        
+        # Experience, job title and the general-skill filters need the whole
+        # utterance, so the final profile comes from one pass over the full text
+        extraction_result = self.skill_extractor.extract_from_utterance(
+            transcription_result['text']
+        )
+        
+        return transcription_result, extraction_result
+    
     def create_worker_profile(
         self, 
         text: str, 
@@ -289,19 +522,15 @@ class SkillSyncPipeline:
         Returns:
             List of profiles
         """
-        print(f"\n\nBatch processing {len(texts)} utterances...")
+        logger.debug("Batch processing %d utterances...", len(texts))
         
-        profiles = []
-        for i, text in enumerate(texts, 1):
-            print(f"\nProcessing {i}/{len(texts)}...")
-            profile = self.process_text_input(text)
-            profiles.append(profile)
+        profiles = self.process_text_batch(texts)
         
         if output_file:
             Path(output_file).parent.mkdir(parents=True, exist_ok=True)
             with open(output_file, 'w') as f:
                 json.dump(profiles, f, indent=2)
-            print(f"\n✓ Results saved to {output_file}")
+            logger.debug("✓ Results saved to %s", output_file)
         
         return profiles
     
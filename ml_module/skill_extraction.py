@@ -10,14 +10,29 @@ This module:
 
 import pandas as pd
 import numpy as np
-import torch
-from transformers import AutoTokenizer, AutoModelForTokenClassification, pipeline
-import spacy
 from typing import List, Dict, Tuple
 import re
 import json
 from pathlib import Path
 
+from skill_taxonomy import load_skill_taxonomy
+
+# Patterns compiled once at import
+_WS_RE = re.compile(r'\s+')
+
+# Pattern: "X years", "X year"
+_EXP_RE = re.compile(r'(\d+)\s*(?:years?|yrs?)')
+
+# Common job title patterns
+_JOB_RES = [
+    re.compile(r'i am (?:a |an )?(\w+)'),
+    re.compile(r'i work as (?:a |an )?(\w+)'),
+    re.compile(r'my job is (\w+)'),
+]
+
+# Abbreviations expanded by preprocess_text, in order
+_ABBREVIATIONS = [("yr", "year"), ("yrs", "years"), ("exp", "experience")]
+
 
 class SkillExtractor:
     """Extract skills from worker utterances using NLP"""
@@ -30,29 +45,38 @@ class SkillExtractor:
             model_name: Hugging Face model for multilingual NER
             skill_taxonomy_path: Path to skill taxonomy CSV
         """
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        print(f"Using device: {self.device}")
-        
         # Load skill taxonomy
         self.skill_taxonomy = self._load_skill_taxonomy(skill_taxonomy_path)
         
-        # Initialize tokenizer and model
-        print(f"Loading {model_name} model...")
-        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        
         # For now, we'll use pattern matching and keyword extraction
-        # You can fine-tune this model later with your dataset
+        # The NER model is only loaded on demand via enable_ner()
         self.model_name = model_name
+        self.device = None
+        self.tokenizer = None
         
         # Create skill keyword dictionary
         self.skill_keywords = self._create_skill_keywords()
         
         print("✓ Skill Extractor initialized")
     
+    def enable_ner(self):
+        """Load the tokenizer for the (optional) NER model"""
+        if self.tokenizer is not None:
+            return
+        
+        import torch
+        from transformers import AutoTokenizer
+        
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        print(f"Using device: {self.device}")
+        
+        print(f"Loading {self.model_name} model...")
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+    
     def _load_skill_taxonomy(self, path: str) -> pd.DataFrame:
         """Load skill taxonomy from CSV"""
         if Path(path).exists():
-            return pd.read_csv(path)
+            return load_skill_taxonomy(path)
         else:
             print(f"Warning: Skill taxonomy not found at {path}")
             return pd.DataFrame()
@@ -86,12 +110,11 @@ class SkillExtractor:
         text = text.lower()
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS_RE.sub(' ', text).strip()
         
         # Handle common abbreviations
-        text = text.replace("yr", "year")
-        text = text.replace("yrs", "years")
-        text = text.replace("exp", "experience")
+        for short, full in _ABBREVIATIONS:
+            text = text.replace(short, full)
         
         return text
     
@@ -105,7 +128,10 @@ class SkillExtractor:
         Returns:
             List of extracted skills with metadata
         """
-        text_clean = self.preprocess_text(text)
+        return self._extract_skills(self.preprocess_text(text))
+    
+    def _extract_skills(self, text_clean: str) -> List[Dict]:
+        """Rule-based skill matching on already preprocessed text"""
         extracted_skills = []
         
         # Match against skill keywords
@@ -132,30 +158,25 @@ class SkillExtractor:
     
     def extract_experience_years(self, text: str) -> int:
         """Extract years of experience from text"""
-        text_clean = self.preprocess_text(text)
-        
-        # Pattern: "X years", "X year"
-        pattern = r'(\d+)\s*(?:years?|yrs?)'
-        matches = re.findall(pattern, text_clean)
+        return self._extract_experience(self.preprocess_text(text))
+    
+    def _extract_experience(self, text_clean: str) -> int:
+        """Extract years of experience from already preprocessed text"""
+        match = _EXP_RE.search(text_clean)
         
-        if matches:
-            return int(matches[0])
+        if match:
+            return int(match.group(1))
         
         return 0
     
     def extract_job_title(self, text: str) -> str:
         """Extract job title from text"""
-        text_clean = self.preprocess_text(text)
-        
-        # Common job title patterns
-        job_patterns = [
-            r'i am (?:a |an )?(\w+)',
-            r'i work as (?:a |an )?(\w+)',
-            r'my job is (\w+)',
-        ]
-        
-        for pattern in job_patterns:
-            match = re.search(pattern, text_clean)
+        return self._extract_job_title(self.preprocess_text(text))
+    
+    def _extract_job_title(self, text_clean: str) -> str:
+        """Extract job title from already preprocessed text"""
+        for pattern in _JOB_RES:
+            match = pattern.search(text_clean)
             if match:
                 return match.group(1).title()
         
@@ -171,10 +192,21 @@ class SkillExtractor:
         Returns:
             Dictionary with extracted information
         """
-        skills = self.extract_skills_rule_based(text)
-        experience = self.extract_experience_years(text)
-        job_title = self.extract_job_title(text)
+        text_clean = self.preprocess_text(text)
+        skills = self._extract_skills(text_clean)
+        experience = self._extract_experience(text_clean)
+        job_title = self._extract_job_title(text_clean)
         
+        return self._build_result(text, skills, experience, job_title)
+    
+    def _build_result(
+        self,
+        text: str,
+        skills: List[Dict],
+        experience: int,
+        job_title: str
+    ) -> Dict:
+        """Assemble the extraction result dictionary"""
         return {
             'text': text,
             'skills': skills,
@@ -192,11 +224,29 @@ class SkillExtractor:
             texts: List of utterances
             
         Returns:
-            List of extraction results
+            List of extraction results, aligned with input order
         """
+        if not texts:
+            return []
+        
+        # Same steps as preprocess_text, run column-wise over all texts
+        cleaned = pd.Series(texts, dtype=object).str.lower()
+        cleaned = cleaned.str.replace(_WS_RE, ' ', regex=True).str.strip()
+        for short, full in _ABBREVIATIONS:
+            cleaned = cleaned.str.replace(short, full, regex=False)
+        
+        experience = (
+            cleaned.str.extract(_EXP_RE, expand=False)
+            .fillna(0)
+            .astype(int)
+            .tolist()
+        )
+        
         results = []
-        for text in texts:
-            results.append(self.extract_from_utterance(text))
+        for text, text_clean, exp in zip(texts, cleaned.tolist(), experience):
+            skills = self._extract_skills(text_clean)
+            job_title = self._extract_job_title(text_clean)
+            results.append(self._build_result(text, skills, exp, job_title))
         return results
     
     def evaluate_on_dataset(self, dataset_path: str) -> Dict:
@@ -215,19 +265,16 @@ class SkillExtractor:
         
         df = pd.read_csv(dataset_path)
         
-        correct = 0
         total = len(df)
         
-        for _, row in df.iterrows():
-            text = row['text']
-            true_skills = set(str(row['extracted_skills']).split(', '))
-            
-            result = self.extract_from_utterance(text)
-            predicted_skills = set([s['skill'] for s in result['skills']])
-            
-            # Simple accuracy: check if at least one skill matches
-            if predicted_skills & true_skills:
-                correct += 1
+        predictions = self.batch_extract(df['text'].tolist())
+        pred_sets = [frozenset(s['skill'] for s in r['skills']) for r in predictions]
+        true_sets = (
+            df['extracted_skills'].astype(str).str.split(', ').map(frozenset).tolist()
+        )
+        
+        # Simple accuracy: check if at least one skill matches
+        correct = sum(bool(p & t) for p, t in zip(pred_sets, true_sets))
         
         accuracy = correct / total if total > 0 else 0
         
@@ -5,10 +5,558 @@ Supports: English, Hindi, Tamil, Telugu, Kannada
 """
 
 import pandas as pd
+import hashlib
+import os
+import pickle
 import re
-from typing import List, Dict
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, List, Dict, Tuple
 from pathlib import Path
 
+from skill_taxonomy import load_skill_taxonomy
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    # Optional compiled trie walk, built with: cythonize -3 -i skill_scanner.pyx
+    import skill_scanner
+    SKILL_SCANNER_AVAILABLE = True
+except ImportError:
+    SKILL_SCANNER_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import numba
+    import numpy as np
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Without pyahocorasick, texts shorter than this are scanned with the keyword
+# trie; longer ones with the script-pruned regexes, which win once the text
+# is long enough to amortise their per-skill searches. The compiled trie walk
+# stays ahead for much longer texts than the pure Python one
+TRIE_MAX_CHARS = 4096 if SKILL_SCANNER_AVAILABLE else 512
+
+# RE2's linear-time DFA only pays off on long texts (full transcripts); on
+# utterance-sized text its per-call overhead makes it slower than re
+RE2_MIN_CHARS = 1024
+
+# "<number> years" in any supported language, compiled once at import.
+# Group 1 is the number; the next group says which language matched:
+# 2 English, 3 Hindi, 4 Tamil, 5 Telugu, 6 Kannada
+_YEARS_RE = re.compile(
+    r'(\d+)\s*(?:'
+    r'(years?|yrs?)'
+    r'|(साल|वर्ष|वर्षों)'
+    r'|(வருட|வருடம்|வருடங்கள்)'
+    r'|(సంవత్సర|సంవత్సరాల)'
+    r'|(ವರ್ಷ|ವರ್ಷದ)'
+    r')'
+)
+
+# Script bits for keyword pruning as (first codepoint, end, bit). Spaces,
+# digits and any other characters do not set a bit
+_SCRIPT_RANGES = (
+    (ord('A'), ord('Z') + 1, 1),
+    (ord('a'), ord('z') + 1, 1),
+    (0x0900, 0x0980, 2),    # Devanagari
+    (0x0B80, 0x0C00, 4),    # Tamil
+    (0x0C00, 0x0C80, 8),    # Telugu
+    (0x0C80, 0x0D00, 16),   # Kannada
+)
+_SCRIPT_BITS = {
+    chr(c): bit for start, stop, bit in _SCRIPT_RANGES for c in range(start, stop)
+}
+
+
+def _script_mask(text: str) -> int:
+    """OR of the script bits of every character in text"""
+    if NUMBA_AVAILABLE:
+        # surrogatepass: lone surrogates (surrogateescape input) encode as
+        # their code unit, which has no script bit, as in the Python scan
+        return int(_script_mask_codepoints(
+            np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        ))
+    
+    mask = 0
+    for ch in set(text):
+        mask |= _SCRIPT_BITS.get(ch, 0)
+    return mask
+
+
+if NUMBA_AVAILABLE:
+    _SCRIPT_RANGE_ARRAY = np.array(_SCRIPT_RANGES, dtype=np.uint32)
+    
+    @numba.njit(cache=True)
+    def _script_mask_codepoints(codepoints):
+        """_script_mask over UTF-32 codepoints; compiled once, cached on disk"""
+        # Global arrays are frozen into the compiled code as constants
+        ranges = _SCRIPT_RANGE_ARRAY
+        mask = 0
+        for c in codepoints:
+            for r in range(ranges.shape[0]):
+                if ranges[r, 0] <= c < ranges[r, 1]:
+                    mask |= ranges[r, 2]
+                    break
+        return mask
+
+
+def _compile_by_script(keywords: Tuple[str, ...], compile=re.compile) -> Tuple:
+    """
+    Compile keywords into one alternation per script mask
+    
+    Args:
+        keywords: Lowercase keywords of one skill
+        compile: Regex compiler (re.compile or re2.compile)
+        
+    Returns:
+        Tuple of (script mask, compiled alternation) pairs
+    """
+    groups = {}
+    for keyword in keywords:
+        groups.setdefault(_script_mask(keyword), []).append(keyword)
+    return tuple(
+        (mask, compile('|'.join(map(re.escape, kws)))) for mask, kws in groups.items()
+    )
+
+
+# One matched skill; converted to a dict only at the public API boundary
+Match = namedtuple('Match', 'skill category confidence method matched_keyword')
+
+_METHOD = sys.intern('multilingual_keyword')
+
+# Any of these makes a "General Repair" match redundant
+_SPECIFIC_REPAIRS = frozenset({
+    'Mobile Repair', 'Two Wheeler Repair', 'Four Wheeler Repair',
+    'Electrical Wiring', 'Pipe Fitting', 'Tap Repair'
+})
+
+
+def _ids_by_keyword(pairs) -> Dict[str, Tuple[int, ...]]:
+    """Group (keyword, id) pairs into keyword -> ids (a keyword can have several)"""
+    ids = {}
+    for keyword, i in pairs:
+        ids.setdefault(keyword, []).append(i)
+    return {keyword: tuple(v) for keyword, v in ids.items()}
+
+
+def _build_automaton(keyword_ids: Dict[str, Tuple[int, ...]]):
+    """
+    Build an Aho-Corasick automaton over a set of keywords
+    
+    Args:
+        keyword_ids: Mapping of lowercase keyword to the ids it stands for
+        
+    Returns:
+        Automaton whose values are the keyword's ids
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword, ids in keyword_ids.items():
+        automaton.add_word(keyword, ids)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_trie(keyword_ids: Dict[str, Tuple[int, ...]]) -> dict:
+    """
+    Build a character trie over a set of keywords
+    
+    Args:
+        keyword_ids: Mapping of lowercase keyword to the ids it stands for
+        
+    Returns:
+        Nested dicts keyed by character; the '' entry of a node where a
+        keyword ends holds the keyword's ids, as in the automaton
+    """
+    root = {}
+    for keyword, ids in keyword_ids.items():
+        node = root
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = ids
+    return root
+
+
+def _trie_iter(trie: dict, text: str):
+    """
+    Yield (end index, keyword ids) for every keyword occurrence in text,
+    like Automaton.iter, by walking the trie from each start offset
+    """
+    n = len(text)
+    for i, ch in enumerate(text):
+        # Most offsets fail here: the character starts no keyword
+        node = trie.get(ch)
+        j = i + 1
+        while node is not None:
+            value = node.get('')
+            if value is not None:
+                yield j - 1, value
+            if j == n:
+                break
+            node = node.get(text[j])
+            j += 1
+
+
+# Compiled walk (same items, as a list) when skill_scanner has been built
+_trie_scan = skill_scanner.scan if SKILL_SCANNER_AVAILABLE else _trie_iter
+
+
+# Comprehensive multilingual skill keywords (read-only; tuples, not lists)
+_MULTILINGUAL_KEYWORDS = MappingProxyType({
+    # ELECTRICAL WORK
+    'Electrical Wiring': (
+        'wiring', 'wire', 'electrical', 'electric', 'इलेक्ट्रिक', 'वायरिंग',
+        'மின்சாரம்', 'வயரிங்', 'విద్యుత్', 'వైరింగ్', 'ವಿದ್ಯುತ್', 'ವೈರಿಂಗ್',
+        'house wiring', 'घर की वायरिंग', 'வீட்டு வயரிங்'
+    ),
+    'Fan Installation': (
+        'fan', 'पंखा', 'விசிறி', 'ఫ్యాన్', 'ಫ್ಯಾನ್',
+        'fan installation', 'fan fitting', 'पंखा लगाना'
+    ),
+    'Switch Board Repair': (
+        'switch', 'board', 'स्विच', 'स्विच बोर्ड', 'சுவிட்ச்', 'స్విచ్', 'ಸ್ವಿಚ್',
+        'switchboard', 'switch board'
+    ),
+    'Motor Winding': (
+        'motor', 'winding', 'मोटर', 'वाइंडिंग', 'மோட்டார்', 'మోటార్', 'ಮೋಟಾರ್',
+        'motor repair', 'motor winding'
+    ),
+
+    # PLUMBING
+    'Pipe Fitting': (
+        'pipe', 'plumbing', 'पाइप', 'प्लंबिंग', 'குழாய்', 'పైప్', 'ಪೈಪ್',
+        'pipe fitting', 'pipe work', 'पाइप फिटिंग'
+    ),
+    'Tap Repair': (
+        'tap', 'नल', 'குழாய்', 'కుళాయి', 'ಟ್ಯಾಪ್',
+        'tap repair', 'नल की मरम्मत', 'leak', 'leakage'
+    ),
+
+    # WELDING
+    'Arc Welding': (
+        'weld', 'welding', 'वेल्डिंग', 'வெல்டிங்', 'వెల్డింగ్', 'ವೆಲ್ಡಿಂಗ್',
+        'arc welding'
+    ),
+    'Steel Fabrication': (
+        'steel', 'fabrication', 'स्टील', 'फैब्रिकेशन', 'இரும்பு', 'ఉక్కు', 'ಉಕ್ಕು',
+        'steel work', 'steel fabrication'
+    ),
+    'Gate Making': (
+        'gate', 'गेट', 'வாயில்', 'గేట్', 'ಗೇಟ್',
+        'gate making', 'gate work'
+    ),
+
+    # CARPENTRY
+    'Wood Cutting': (
+        'wood cutting', 'लकड़ी काटना', 'மரம் வெட்டுதல்',
+        'wood work', 'wood', 'लकड़ी', 'மரம்', 'చెక్క', 'ಮರ'
+    ),
+    'Furniture Making': (
+        'furniture', 'फर्नीचर', 'பர்னிச்சர்', 'ఫర్నిచర్', 'ಪೀಠೋಪಕರಣ',
+        'carpenter', 'carpentry', 'बढ़ई', 'தச்சு', 'వడ్రంగి', 'ಬಡಗಿ',
+        'furniture making', 'फर्नीचर बनाना'
+    ),
+    'Door Fitting': (
+        'door', 'दरवाजा', 'கதவு', 'తలుపు', 'ಬಾಗಿಲು',
+        'door fitting', 'door installation', 'दरवाजा लगाना', 'கதவு பொருத்துதல்'
+    ),
+
+    # PAINTING
+    'Wall Painting': (
+        'paint', 'painting', 'पेंटिंग', 'रंग', 'வண்ணம்', 'పెయింటింగ్', 'ಪೇಂಟಿಂಗ್',
+        'wall paint', 'house painting', 'दीवार पेंटिंग'
+    ),
+    'Color Mixing': (
+        'color', 'रंग', 'வண்ணம்', 'రంగు', 'ಬಣ್ಣ',
+        'color mixing'
+    ),
+
+    # DRIVING
+    'Vehicle Driving': (
+        'drive', 'driving', 'driver', 'ड्राइविंग', 'ड्राइवर', 'ஓட்டுதல்', 'డ్రైవింగ్', 'ಚಾಲನೆ',
+        'car driving', 'truck driving', 'vehicle driving',
+        'drive car', 'drive truck', 'drive vehicle', 'drive all vehicle',
+        'i work as driver', 'work as driver'
+    ),
+
+    # TAILORING
+    'Dress Stitching': (
+        'stitch', 'stitching', 'tailor', 'सिलाई', 'दर्जी', 'தையல்', 'కుట్టు', 'ಹೊಲಿಗೆ',
+        'dress', 'cloth', 'कपड़ा'
+    ),
+    'Blouse Stitching': (
+        'blouse', 'ब्लाउज', 'புடவை', 'బ్లౌజ్', 'ಬ್ಲೌಸ್'
+    ),
+    'Saree Fall': (
+        'saree', 'साड़ी', 'புடவை', 'చీర', 'ಸೀರೆ',
+        'fall', 'saree fall'
+    ),
+    'Churidar Making': (
+        'churidar', 'चूड़ीदार', 'சுரிதார்', 'చుడిదార్', 'ಚುಡಿದಾರ'
+    ),
+
+    # MECHANICS
+    'General Repair': (
+        'general repair', 'मरम्मत', 'பழுது', 'రిపేర్', 'ದುರಸ್ತಿ',
+        'maintenance work', 'general maintenance'
+    ),
+    'Two Wheeler Repair': (
+        'bike', 'motorcycle', 'scooter', 'बाइक', 'स्कूटर', 'பைக்', 'బైక్', 'ಬೈಕ್',
+        'two wheeler'
+    ),
+    'Four Wheeler Repair': (
+        'car repair', 'vehicle repair', 'कार मरम्मत', 'गाड़ी मरम्मत',
+        'four wheeler repair', 'car mechanic', 'vehicle mechanic',
+        'auto mechanic', 'automobile repair'
+    ),
+
+    # MOBILE REPAIR
+    'Mobile Repair': (
+        'mobile repair', 'phone repair', 'मोबाइल रिपेयर', 'फोन रिपेयर',
+        'mobile mechanic', 'phone mechanic', 'mobile fixing', 'phone fixing',
+        'cell phone repair', 'smartphone repair',
+        'iphone repair', 'samsung repair', 'android repair',
+        'all icon', 'all brands', 'सभी ब्रांड',
+        'mobile', 'phone', 'मोबाइल', 'फोन', 'மொபைல்', 'ఫోన్', 'ಮೊಬೈಲ್'
+    ),
+    'Screen Replacement': (
+        'screen replacement', 'screen repair', 'screen change',
+        'display replacement', 'display repair',
+        'screen', 'display', 'स्क्रीन', 'डिस्प्ले', 'திரை', 'స్క్రీన్', 'ಪರದೆ'
+    ),
+    'Battery Replacement': (
+        'battery replacement', 'battery change', 'battery repair',
+        'battery', 'बैटरी', 'பேட்டரி', 'బ్యాటరీ', 'ಬ್ಯಾಟರಿ'
+    ),
+    'Software Troubleshooting': (
+        'software issue', 'software problem', 'software troubleshooting',
+        'software repair', 'software fix', 'software issues',
+        'software', 'सॉफ्टवेयर', 'மென்பொருள்', 'సాఫ్ట్‌వేర్', 'ಸಾಫ್ಟ್‌ವೇರ್'
+    ),
+
+    # BEAUTY/SALON
+    'Hair Cutting': (
+        'hair', 'haircut', 'बाल', 'हेयरकट', 'முடி', 'హెయిర్', 'ಕೂದಲು',
+        'hair cut', 'हेयर कट', 'ஹேர் கட்'
+    ),
+    'Facial Treatment': (
+        'facial', 'फेशियल', 'முக', 'ఫేషియల్', 'ಫೇಶಿಯಲ್',
+        'face treatment'
+    ),
+    'Makeup': (
+        'makeup', 'मेकअप', 'ஒப்பனை', 'మేకప్', 'ಮೇಕಪ್',
+        'make up', 'मेक अप'
+    ),
+    'Beauty Parlor': (
+        'beauty', 'parlor', 'parlour', 'salon', 'ब्यूटी', 'पार्लर',
+        'அழகு', 'సెలూన్', 'ಬ್ಯೂಟಿ', 'ಪಾರ್ಲರ್'
+    ),
+})
+
+# Job title patterns
+_JOB_TITLES = MappingProxyType({
+    'Electrician': (
+        'electrician', 'electric', 'इलेक्ट्रीशियन', 'மின்சார', 'ఎలక్ట్రీషియన్', 'ಎಲೆಕ್ಟ್ರಿಷಿಯನ್'
+    ),
+    'Plumber': (
+        'plumber', 'plumbing', 'प्लंबर', 'பிளம்பர்', 'ప్లంబర్', 'ಪ್ಲಂಬರ್'
+    ),
+    'Carpenter': (
+        'carpenter', 'carpentry', 'बढ़ई', 'தச்சு', 'వడ్రంగి', 'ಬಡಗಿ'
+    ),
+    'Welder': (
+        'welder', 'welding', 'वेल्डर', 'வெல்டர்', 'వెల్డర్', 'ವೆಲ್ಡರ್'
+    ),
+    'Painter': (
+        'painter', 'painting', 'पेंटर', 'ஓவியர்', 'పెయింటర్', 'ಪೇಂಟರ್'
+    ),
+    'Driver': (
+        'driver', 'driving', 'ड्राइवर', 'ஓட்டுநர்', 'డ్రైవర్', 'ಚಾಲಕ'
+    ),
+    'Tailor': (
+        'tailor', 'दर्जी', 'தையல்காரர்', 'దర్జీ', 'ಟೈಲರ್'
+    ),
+    'Mechanic': (
+        'mechanic', 'मैकेनिक', 'மெக்கானிக்', 'మెకానిక్', 'ಮೆಕ್ಯಾನಿಕ್'
+    ),
+    'Beautician': (
+        'beautician', 'beauty', 'parlor', 'ब्यूटीशियन', 'அழகு', 'బ్యూటీషియన్', 'ಬ್ಯೂಟಿ'
+    ),
+})
+
+# Keywords are matched against lowercased text; lowercase them once here
+# (skill names interned, so every Match shares one string per skill)
+_LC_KEYWORDS = {
+    sys.intern(skill): tuple(k.lower() for k in kws)
+    for skill, kws in _MULTILINGUAL_KEYWORDS.items()
+}
+_LC_TITLES = {
+    title: tuple(k.lower() for k in kws) for title, kws in _JOB_TITLES.items()
+}
+
+# Match priority never changes, so order it once: skills by their longest
+# keyword, and each skill's keywords longest (most specific) first
+_SKILLS_SORTED = tuple(sorted(
+    (
+        (skill, tuple(sorted(kws, key=len, reverse=True)))
+        for skill, kws in _LC_KEYWORDS.items()
+    ),
+    key=lambda x: len(x[1][0]),
+    reverse=True
+))
+
+# The same order as flat parallel tuples: skill ids are priority ranks, and
+# keyword k (skill _KW_SKILL_ID[k]) outranks every keyword after it. A
+# skill's keywords are contiguous, from _SKILL_KW_START[sid] up to
+# _SKILL_KW_START[sid + 1]
+_SKILL_NAMES = tuple(skill for skill, _ in _SKILLS_SORTED)
+_KW_TEXT = tuple(kw for _, kws in _SKILLS_SORTED for kw in kws)
+_KW_SKILL_ID = tuple(sid for sid, (_, kws) in enumerate(_SKILLS_SORTED) for _ in kws)
+_SKILL_KW_START = (0,) + tuple(
+    sum(len(kws) for _, kws in _SKILLS_SORTED[:sid + 1]) for sid in range(len(_SKILLS_SORTED))
+)
+_SKILL_KW_IDS = _ids_by_keyword((kw, k) for k, kw in enumerate(_KW_TEXT))
+
+# Job titles are ranked by table order; the first one found wins
+_TITLE_NAMES = tuple(_LC_TITLES)
+_TITLE_KW_IDS = _ids_by_keyword(
+    (kw, tid) for tid, kws in enumerate(_LC_TITLES.values()) for kw in kws
+)
+
+# Bumped when the pickled matcher layout changes
+_MATCHER_CACHE_VERSION = 2
+
+
+def _build_category_map(taxonomy_path: Path) -> Dict[str, str]:
+    """Read skill -> category from the taxonomy"""
+    taxonomy = load_skill_taxonomy(taxonomy_path)
+    
+    # Only skill -> category is needed per match; the first row wins, as
+    # with the DataFrame lookup this replaces
+    category_map = {}
+    for skill_name, category in zip(taxonomy['skill_name'], taxonomy['category']):
+        if isinstance(category, str):
+            category = sys.intern(category)
+        category_map.setdefault(skill_name, category)
+    return category_map
+
+
+def _matcher_cache_path(taxonomy_path: Path) -> Path:
+    """Pickle next to the taxonomy, keyed by the keyword tables and backend"""
+    key = repr((
+        sorted(_LC_KEYWORDS.items()),
+        sorted(_LC_TITLES.items()),
+        AHOCORASICK_AVAILABLE,
+        _MATCHER_CACHE_VERSION
+    ))
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    return taxonomy_path.with_name(f".skill_ac_{digest}.pkl")
+
+
+def _load_matcher_cache(cache_path: Path, taxonomy_path: Path):
+    """Return (category map, skill automaton, title automaton) if the cache is current"""
+    if not cache_path.exists() or cache_path.stat().st_mtime < taxonomy_path.stat().st_mtime:
+        return None
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            state = pickle.load(f)
+        return state['category_map'], state['ac'], state['ac_titles']
+    except Exception as e:
+        # Truncated file, or pickled by an incompatible pyahocorasick
+        print(f"Warning: Ignoring keyword matcher cache {cache_path}: {e}")
+        return None
+
+
+def _save_matcher_cache(cache_path: Path, category_map, ac, ac_titles):
+    """Pickle the category map and automata; written atomically via os.replace"""
+    state = {
+        'category_map': category_map,
+        'ac': ac,
+        'ac_titles': ac_titles
+    }
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not cache keyword matcher: {e}")
+
+
+@lru_cache(maxsize=4)
+def _load_matchers(taxonomy_path: str, mtime: float):
+    """
+    Category map and automata for a taxonomy, shared by every extractor in
+    the process; `mtime` is part of the key so taxonomy edits invalidate it
+    
+    Returns:
+        (category map, skill automaton, title automaton); the automata are
+        None without pyahocorasick
+    """
+    taxonomy_path = Path(taxonomy_path)
+    
+    # Read from the on-disk cache when it is current; otherwise build and
+    # (re)write it
+    cache_path = _matcher_cache_path(taxonomy_path)
+    cached = _load_matcher_cache(cache_path, taxonomy_path)
+    if cached is not None:
+        return cached
+    
+    category_map = _build_category_map(taxonomy_path)
+    
+    # One automaton pass per text finds every keyword (overlaps included)
+    ac = None
+    ac_titles = None
+    if AHOCORASICK_AVAILABLE:
+        ac = _build_automaton(_SKILL_KW_IDS)
+        ac_titles = _build_automaton(_TITLE_KW_IDS)
+    
+    _save_matcher_cache(cache_path, category_map, ac, ac_titles)
+    return category_map, ac, ac_titles
+
+
+@lru_cache(maxsize=None)
+def _fallback_matchers():
+    """
+    Keyword matchers used without pyahocorasick, built once per process
+    
+    A character trie over the skill keywords for short texts, compiled
+    alternations per skill (one per script, so a Hindi-only text
+    never runs the Tamil keywords), and one union over all job titles with a
+    capture group per title. The lookahead tests every start position, so
+    overlapping keywords are not hidden by an earlier match. RE2 has no
+    lookahead, so the title union always uses re
+    
+    Returns:
+        (skill keyword trie, script groups indexed by skill id, the same
+        compiled with RE2 for texts of RE2_MIN_CHARS or more, job title union)
+    """
+    trie = _build_trie(_SKILL_KW_IDS)
+    skill_res = tuple(_compile_by_script(kws) for _, kws in _SKILLS_SORTED)
+    skill_res_long = skill_res
+    if RE2_AVAILABLE:
+        skill_res_long = tuple(
+            _compile_by_script(kws, re2.compile) for _, kws in _SKILLS_SORTED
+        )
+    job_title_re = re.compile('(?=' + '|'.join(
+        '(' + '|'.join(map(re.escape, kws)) + ')' for kws in _LC_TITLES.values()
+    ) + ')')
+    return trie, skill_res, skill_res_long, job_title_re
+
 
 class MultilingualSkillExtractor:
     """
@@ -18,311 +566,183 @@ class MultilingualSkillExtractor:
     
     def __init__(self, skill_taxonomy_path="datasets/skill_taxonomy.csv"):
         """Initialize with comprehensive multilingual mappings"""
-        self.skill_taxonomy = pd.read_csv(skill_taxonomy_path)
+        # Keyword tables are frozen module constants shared by every instance
+        self.multilingual_keywords = _MULTILINGUAL_KEYWORDS
+        self.job_titles = _JOB_TITLES
         
-        # Comprehensive multilingual skill keywords
-        self.multilingual_keywords = {
-            # ELECTRICAL WORK
-            'Electrical Wiring': [
-                'wiring', 'wire', 'electrical', 'electric', 'इलेक्ट्रिक', 'वायरिंग',
-                'மின்சாரம்', 'வயரிங்', 'విద్యుత్', 'వైరింగ్', 'ವಿದ್ಯುತ್', 'ವೈರಿಂಗ್',
-                'house wiring', 'घर की वायरिंग', 'வீட்டு வயரிங்'
-            ],
-            'Fan Installation': [
-                'fan', 'पंखा', 'விசிறி', 'ఫ్యాన్', 'ಫ್ಯಾನ್',
-                'fan installation', 'fan fitting', 'पंखा लगाना'
-            ],
-            'Switch Board Repair': [
-                'switch', 'board', 'स्विच', 'स्विच बोर्ड', 'சுவிட்ச்', 'స్విచ్', 'ಸ್ವಿಚ್',
-                'switchboard', 'switch board'
-            ],
-            'Motor Winding': [
-                'motor', 'winding', 'मोटर', 'वाइंडिंग', 'மோட்டார்', 'మోటార్', 'ಮೋಟಾರ್',
-                'motor repair', 'motor winding'
-            ],
-            
-            # PLUMBING
-            'Pipe Fitting': [
-                'pipe', 'plumbing', 'पाइप', 'प्लंबिंग', 'குழாய்', 'పైప్', 'ಪೈಪ್',
-                'pipe fitting', 'pipe work', 'पाइप फिटिंग'
-            ],
-            'Tap Repair': [
-                'tap', 'नल', 'குழாய்', 'కుళాయి', 'ಟ್ಯಾಪ್',
-                'tap repair', 'नल की मरम्मत', 'leak', 'leakage'
-            ],
-            
-            # WELDING
-            'Arc Welding': [
-                'weld', 'welding', 'वेल्डिंग', 'வெல்டிங்', 'వెల్డింగ్', 'ವೆಲ್ಡಿಂಗ್',
-                'arc welding'
-            ],
-            'Steel Fabrication': [
-                'steel', 'fabrication', 'स्टील', 'फैब्रिकेशन', 'இரும்பு', 'ఉక్కు', 'ಉಕ್ಕು',
-                'steel work', 'steel fabrication'
-            ],
-            'Gate Making': [
-                'gate', 'गेट', 'வாயில்', 'గేట్', 'ಗೇಟ್',
-                'gate making', 'gate work'
-            ],
-            
-            # CARPENTRY
-            'Wood Cutting': [
-                'wood cutting', 'लकड़ी काटना', 'மரம் வெட்டுதல்',
-                'wood work', 'wood', 'लकड़ी', 'மரம்', 'చెక్క', 'ಮರ'
-            ],
-            'Furniture Making': [
-                'furniture', 'फर्नीचर', 'பர்னிச்சர்', 'ఫర్నిచర్', 'ಪೀಠೋಪಕರಣ',
-                'carpenter', 'carpentry', 'बढ़ई', 'தச்சு', 'వడ్రంగి', 'ಬಡಗಿ',
-                'furniture making', 'फर्नीचर बनाना'
-            ],
-            'Door Fitting': [
-                'door', 'दरवाजा', 'கதவு', 'తలుపు', 'ಬಾಗಿಲು',
-                'door fitting', 'door installation', 'दरवाजा लगाना', 'கதவு பொருத்துதல்'
-            ],
-            
-            # PAINTING
-            'Wall Painting': [
-                'paint', 'painting', 'पेंटिंग', 'रंग', 'வண்ணம்', 'పెయింటింగ్', 'ಪೇಂಟಿಂಗ್',
-                'wall paint', 'house painting', 'दीवार पेंटिंग'
-            ],
-            'Color Mixing': [
-                'color', 'रंग', 'வண்ணம்', 'రంగు', 'ಬಣ್ಣ',
-                'color mixing'
-            ],
-            
-            # DRIVING
-            'Vehicle Driving': [
-                'drive', 'driving', 'driver', 'ड्राइविंग', 'ड्राइवर', 'ஓட்டுதல்', 'డ్రైవింగ్', 'ಚಾಲನೆ',
-                'car driving', 'truck driving', 'vehicle driving',
-                'drive car', 'drive truck', 'drive vehicle', 'drive all vehicle',
-                'i work as driver', 'work as driver'
-            ],
-            
-            # TAILORING
-            'Dress Stitching': [
-                'stitch', 'stitching', 'tailor', 'सिलाई', 'दर्जी', 'தையல்', 'కుట్టు', 'ಹೊಲಿಗೆ',
-                'dress', 'cloth', 'कपड़ा'
-            ],
-            'Blouse Stitching': [
-                'blouse', 'ब्लाउज', 'புடவை', 'బ్లౌజ్', 'ಬ್ಲೌಸ್'
-            ],
-            'Saree Fall': [
-                'saree', 'साड़ी', 'புடவை', 'చీర', 'ಸೀರೆ',
-                'fall', 'saree fall'
-            ],
-            'Churidar Making': [
-                'churidar', 'चूड़ीदार', 'சுரிதார்', 'చుడిదార్', 'ಚುಡಿದಾರ'
-            ],
-            
-            # MECHANICS
-            'General Repair': [
-                'general repair', 'मरम्मत', 'பழுது', 'రిపేర్', 'ದುರಸ್ತಿ',
-                'maintenance work', 'general maintenance'
-            ],
-            'Two Wheeler Repair': [
-                'bike', 'motorcycle', 'scooter', 'बाइक', 'स्कूटर', 'பைக்', 'బైక్', 'ಬೈಕ್',
-                'two wheeler'
-            ],
-            'Four Wheeler Repair': [
-                'car repair', 'vehicle repair', 'कार मरम्मत', 'गाड़ी मरम्मत',
-                'four wheeler repair', 'car mechanic', 'vehicle mechanic',
-                'auto mechanic', 'automobile repair'
-            ],
-            
-            # MOBILE REPAIR
-            'Mobile Repair': [
-                'mobile repair', 'phone repair', 'मोबाइल रिपेयर', 'फोन रिपेयर',
-                'mobile mechanic', 'phone mechanic', 'mobile fixing', 'phone fixing',
-                'cell phone repair', 'smartphone repair',
-                'iphone repair', 'samsung repair', 'android repair',
-                'all icon', 'all brands', 'सभी ब्रांड',
-                'mobile', 'phone', 'मोबाइल', 'फोन', 'மொபைல்', 'ఫోన్', 'ಮೊಬೈಲ್'
-            ],
-            'Screen Replacement': [
-                'screen replacement', 'screen repair', 'screen change',
-                'display replacement', 'display repair',
-                'screen', 'display', 'स्क्रीन', 'डिस्प्ले', 'திரை', 'స్క్రీన్', 'ಪರದೆ'
-            ],
-            'Battery Replacement': [
-                'battery replacement', 'battery change', 'battery repair',
-                'battery', 'बैटरी', 'பேட்டரி', 'బ్యాటరీ', 'ಬ್ಯಾಟರಿ'
-            ],
-            'Software Troubleshooting': [
-                'software issue', 'software problem', 'software troubleshooting',
-                'software repair', 'software fix', 'software issues',
-                'software', 'सॉफ्टवेयर', 'மென்பொருள்', 'సాఫ్ట్‌వేర్', 'ಸಾಫ್ಟ್‌ವೇರ್'
-            ],
-            
-            # BEAUTY/SALON
-            'Hair Cutting': [
-                'hair', 'haircut', 'बाल', 'हेयरकट', 'முடி', 'హెయిర్', 'ಕೂದಲು',
-                'hair cut', 'हेयर कट', 'ஹேர் கட்'
-            ],
-            'Facial Treatment': [
-                'facial', 'फेशियल', 'முக', 'ఫేషియల్', 'ಫೇಶಿಯಲ್',
-                'face treatment'
-            ],
-            'Makeup': [
-                'makeup', 'मेकअप', 'ஒப்பனை', 'మేకప్', 'ಮೇಕಪ್',
-                'make up', 'मेक अप'
-            ],
-            'Beauty Parlor': [
-                'beauty', 'parlor', 'parlour', 'salon', 'ब्यूटी', 'पार्लर',
-                'அழகு', 'సెలూన్', 'ಬ್ಯೂಟಿ', 'ಪಾರ್ಲರ್'
-            ],
-        }
-        
-        # Job title patterns
-        self.job_titles = {
-            'Electrician': [
-                'electrician', 'electric', 'इलेक्ट्रीशियन', 'மின்சார', 'ఎలక్ట్రీషియన్', 'ಎಲೆಕ್ಟ್ರಿಷಿಯನ್'
-            ],
-            'Plumber': [
-                'plumber', 'plumbing', 'प्लंबर', 'பிளம்பர்', 'ప్లంబర్', 'ಪ್ಲಂಬರ್'
-            ],
-            'Carpenter': [
-                'carpenter', 'carpentry', 'बढ़ई', 'தச்சு', 'వడ్రంగి', 'ಬಡಗಿ'
-            ],
-            'Welder': [
-                'welder', 'welding', 'वेल्डर', 'வெல்டர்', 'వెల్డర్', 'ವೆಲ್ಡರ್'
-            ],
-            'Painter': [
-                'painter', 'painting', 'पेंटर', 'ஓவியர்', 'పెయింటర్', 'ಪೇಂಟರ್'
-            ],
-            'Driver': [
-                'driver', 'driving', 'ड्राइवर', 'ஓட்டுநர்', 'డ్రైవర్', 'ಚಾಲಕ'
-            ],
-            'Tailor': [
-                'tailor', 'दर्जी', 'தையல்காரர்', 'దర్జీ', 'ಟೈಲರ್'
-            ],
-            'Mechanic': [
-                'mechanic', 'मैकेनिक', 'மெக்கானிக்', 'మెకానిక్', 'ಮೆಕ್ಯಾನಿಕ್'
-            ],
-            'Beautician': [
-                'beautician', 'beauty', 'parlor', 'ब्यूटीशियन', 'அழகு', 'బ్యూటీషియన్', 'ಬ್ಯೂಟಿ'
-            ],
-        }
+        # Category map and automata are built (or read from the on-disk
+        # cache) once per process and taxonomy version
+        taxonomy_path = Path(skill_taxonomy_path).resolve()
+        self._category_map, self._ac, self._ac_titles = _load_matchers(
+            str(taxonomy_path), taxonomy_path.stat().st_mtime
+        )
+        if self._ac is None:
+            (self._trie, self._skill_res, self._skill_res_long,
+             self._job_title_re) = _fallback_matchers()
+    
+    @staticmethod
+    def _hit_ids(hits) -> set:
+        """Return the ids found by one automaton/trie scan"""
+        ids = set()
+        for _, hit in hits:
+            ids.update(hit)
+        return ids
     
     def extract_skills(self, text: str) -> List[Dict]:
         """Extract skills with aggressive multilingual matching + priority"""
-        text_lower = text.lower()
-        extracted = []
-        seen_skills = set()
-        
-        # Priority: Match longer/more specific keywords first
-        # Sort skills by maximum keyword length (descending)
-        sorted_skills = sorted(
-            self.multilingual_keywords.items(),
-            key=lambda x: max(len(kw) for kw in x[1]),
-            reverse=True
-        )
+        return [m._asdict() for m in self._extract_skills(text.lower())]
+    
+    def _extract_skills(self, text_lower: str) -> List[Match]:
+        """Skill matching on already lowercased text"""
+        if self._ac is not None:
+            # Keyword search is done in one pass; the loop below only ranks hits
+            kw_ids = self._hit_ids(self._ac.iter(text_lower))
+        elif len(text_lower) < TRIE_MAX_CHARS:
+            # Same hits as the automaton, from a pure Python trie walk
+            kw_ids = self._hit_ids(_trie_scan(self._trie, text_lower))
+        else:
+            # A keyword can only occur if the text has every script it uses
+            text_mask = _script_mask(text_lower)
+            skill_res = (
+                self._skill_res_long if len(text_lower) >= RE2_MIN_CHARS else self._skill_res
+            )
+            kw_ids = set()
+            for sid, groups in enumerate(skill_res):
+                if any(rx.search(text_lower) for mask, rx in groups if not mask & ~text_mask):
+                    # Only the skill's first keyword present is reported
+                    for k in range(_SKILL_KW_START[sid], _SKILL_KW_START[sid + 1]):
+                        if _KW_TEXT[k] in text_lower:
+                            kw_ids.add(k)
+                            break
         
-        # Match against all multilingual keywords
-        for skill_name, keywords in sorted_skills:
-            # Sort keywords by length (longer = more specific)
-            sorted_keywords = sorted(keywords, key=len, reverse=True)
-            
-            for keyword in sorted_keywords:
-                if keyword.lower() in text_lower:
-                    if skill_name not in seen_skills:
-                        category = self._get_category(skill_name)
-                        extracted.append({
-                            'skill': skill_name,
-                            'category': category,
-                            'confidence': 0.95,
-                            'method': 'multilingual_keyword',
-                            'matched_keyword': keyword
-                        })
-                        seen_skills.add(skill_name)
-                        break  # Found this skill, move to next
+        # Keyword ids are in priority order (longer/more specific skills
+        # first), so the first id seen for a skill is the keyword it reports
+        extracted_by_name = {}
+        for k in sorted(kw_ids):
+            skill_name = _SKILL_NAMES[_KW_SKILL_ID[k]]
+            if skill_name in extracted_by_name:
+                continue
+            category = self._get_category(skill_name)
+            extracted_by_name[skill_name] = Match(skill_name, category, 0.95, _METHOD, _KW_TEXT[k])
         
         # Remove overly general skills if more specific ones exist
-        extracted = self._filter_general_skills(extracted)
+        self._filter_general_skills(extracted_by_name)
         
-        return extracted
+        return list(extracted_by_name.values())
     
-    def _filter_general_skills(self, skills: List[Dict]) -> List[Dict]:
-        """Remove general skills when specific ones exist"""
-        skill_names = [s['skill'] for s in skills]
-        
+    def _filter_general_skills(self, by_name: Dict[str, Match]) -> None:
+        """Remove general skills when specific ones exist (in place, keyed by skill name)"""
         # Remove "General Repair" if any specific repair skill exists
-        if 'General Repair' in skill_names:
-            specific_repairs = ['Mobile Repair', 'Two Wheeler Repair', 'Four Wheeler Repair', 
-                              'Electrical Wiring', 'Pipe Fitting', 'Tap Repair']
-            if any(s in skill_names for s in specific_repairs):
-                skills = [s for s in skills if s['skill'] != 'General Repair']
+        if 'General Repair' in by_name and not _SPECIFIC_REPAIRS.isdisjoint(by_name):
+            del by_name['General Repair']
         
         # Remove "Four Wheeler Repair" if "Vehicle Driving" exists
-        if 'Vehicle Driving' in skill_names and 'Four Wheeler Repair' in skill_names:
-            # Check which one matched more specifically
-            driving_skill = next(s for s in skills if s['skill'] == 'Vehicle Driving')
-            repair_skill = next(s for s in skills if s['skill'] == 'Four Wheeler Repair')
-            
+        if 'Vehicle Driving' in by_name and 'Four Wheeler Repair' in by_name:
             # If driving keywords are present, keep driving
-            if 'drive' in driving_skill.get('matched_keyword', '').lower():
-                skills = [s for s in skills if s['skill'] != 'Four Wheeler Repair']
-        
-        return skills
+            if 'drive' in by_name['Vehicle Driving'].matched_keyword:
+                del by_name['Four Wheeler Repair']
     
     def _get_category(self, skill_name: str) -> str:
         """Get category for a skill"""
-        match = self.skill_taxonomy[self.skill_taxonomy['skill_name'] == skill_name]
-        if not match.empty:
-            return match.iloc[0]['category']
-        return 'General Skills'
+        return self._category_map.get(skill_name, 'General Skills')
     
     def extract_experience_years(self, text: str) -> int:
         """Extract years of experience - multilingual"""
-        patterns = [
-            # English
-            r'(\d+)\s*(?:years?|yrs?|year)',
-            # Hindi
-            r'(\d+)\s*(?:साल|वर्ष|वर्षों)',
-            # Tamil
-            r'(\d+)\s*(?:வருட|வருடம்|வருடங்கள்)',
-            # Telugu
-            r'(\d+)\s*(?:సంవత్సర|సంవత్సరాల)',
-            # Kannada
-            r'(\d+)\s*(?:ವರ್ಷ|ವರ್ಷದ)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
-                return int(matches[0])
+        return self._extract_experience(text.lower())
+    
+    def _extract_experience(self, text_lower: str) -> int:
+        """Extract years of experience from already lowercased text"""
+        # One scan; an English match anywhere still beats a Hindi one, and so on
+        best = None
+        for match in _YEARS_RE.finditer(text_lower):
+            if best is None or match.lastindex < best.lastindex:
+                best = match
+                if best.lastindex == 2:
+                    break
         
-        return 0
+        return int(best.group(1)) if best else 0
     
     def extract_job_title(self, text: str) -> str:
         """Extract job title - multilingual"""
-        text_lower = text.lower()
+        return self._extract_job_title(text.lower())
+    
+    def _extract_job_title(self, text_lower: str) -> str:
+        """Extract job title from already lowercased text"""
+        if self._ac_titles is not None:
+            hit_titles = self._hit_ids(self._ac_titles.iter(text_lower))
+            # First title in table order wins, as in the substring scan
+            return _TITLE_NAMES[min(hit_titles)] if hit_titles else ""
         
-        for title, keywords in self.job_titles.items():
-            for keyword in keywords:
-                if keyword.lower() in text_lower:
-                    return title
+        # Lowest group number = first title in table order
+        best = None
+        for match in self._job_title_re.finditer(text_lower):
+            if best is None or match.lastindex < best:
+                best = match.lastindex
+                if best == 1:
+                    break
         
-        return ""
+        return _TITLE_NAMES[best - 1] if best else ""
+    
+    def _extract_all(self, text: str) -> Tuple[List[Match], int, str]:
+        """Lowercase once and run the skill, experience and job title extractors"""
+        # Kept as str.lower(): CPython lowercases ASCII and Indic text in one
+        # fast C pass, while translate() with an A-Z-only table is 5-25x slower
+        text_lower = text.lower()
+        return (
+            self._extract_skills(text_lower),
+            self._extract_experience(text_lower),
+            self._extract_job_title(text_lower)
+        )
     
     def extract_from_utterance(self, text: str) -> Dict:
         """Complete extraction"""
-        skills = self.extract_skills(text)
-        experience = self.extract_experience_years(text)
-        job_title = self.extract_job_title(text)
+        matches, experience, job_title = self._extract_all(text)
         
         # Get categories
-        categories = list(set([s['category'] for s in skills]))
+        categories = list(set([m.category for m in matches]))
         primary_category = categories[0] if categories else ""
         
         return {
             'text': text,
-            'skills': skills,
-            'num_skills': len(skills),
+            'skills': [m._asdict() for m in matches],
+            'num_skills': len(matches),
             'experience_years': experience,
             'job_title': job_title,
             'categories': categories,
             'primary_category': primary_category
         }
+    
+    def extract_batch(self, texts: Iterable[str]) -> pd.DataFrame:
+        """
+        Extract skills, experience and job title from many utterances
+        
+        Args:
+            texts: Worker utterances
+            
+        Returns:
+            DataFrame with one row per text (input order): text, skills
+            (skill names), categories, num_skills, experience_years, job_title
+        """
+        texts = list(texts)
+        lowered = pd.Series(texts, dtype=object).str.lower().tolist()
+        
+        # Fill plain columns and build the frame once at the end
+        skills, categories, experience, job_titles = [], [], [], []
+        for text_lower in lowered:
+            matches = self._extract_skills(text_lower)
+            skills.append([m.skill for m in matches])
+            categories.append(list(dict.fromkeys(m.category for m in matches)))
+            experience.append(self._extract_experience(text_lower))
+            job_titles.append(self._extract_job_title(text_lower))
+        
+        return pd.DataFrame({
+            'text': texts,
+            'skills': skills,
+            'categories': categories,
+            'num_skills': [len(s) for s in skills],
+            'experience_years': experience,
+            'job_title': job_titles
+        })
 
 
 # Quick test
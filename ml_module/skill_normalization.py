@@ -11,11 +11,80 @@ This module:
 
 import pandas as pd
 import numpy as np
-from sentence_transformers import SentenceTransformer, util
-from typing import List, Dict, Tuple
+from sentence_transformers import SentenceTransformer
+from sentence_transformers import export_dynamic_quantized_onnx_model
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
+from collections import OrderedDict
+from contextlib import nullcontext
+from functools import lru_cache
+import json
+import os
+import sys
+import threading
 import torch
-import pickle
+from safetensors import safe_open
+from safetensors.torch import save_file
+
+from skill_taxonomy import load_skill_taxonomy, PYARROW_AVAILABLE
+
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+try:
+    import onnxruntime as ort
+    from transformers import AutoTokenizer
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
+
+try:
+    from model2vec import StaticModel
+    MODEL2VEC_AVAILABLE = True
+except ImportError:
+    MODEL2VEC_AVAILABLE = False
+
+# Exported INT8 ONNX models are cached here (one folder per model)
+ONNX_CACHE_DIR = Path("models/onnx")
+ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# IOBinding buffer sets kept for the encode path, one per (batch, seq_len)
+ORT_BINDING_CACHE_SIZE = 16
+
+# Static-embedding (token lookup + mean pool) model for backend="model2vec"
+MODEL2VEC_MODEL = "minishlab/potion-base-8M"
+
+# Taxonomies at least this large are searched through a FAISS HNSW index;
+# below it, brute-force matmul is faster
+FAISS_MIN_SKILLS = 5000
+
+# Max cached (skill, threshold, top_k) lookups per normalizer
+NORMALIZE_CACHE_SIZE = 4096
+
+
+def _onnx_export_dir(model_name: str) -> Path:
+    """Folder holding the exported ONNX model and tokenizer for model_name"""
+    return ONNX_CACHE_DIR / model_name.replace('/', '__')
+
+
+def _score_topk_eager(
+    queries: torch.Tensor,
+    keys: torch.Tensor,
+    k: int
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Cosine scores (unit-norm inputs) and top-k (values, indices) per query"""
+    similarities = queries @ keys.T
+    return torch.topk(similarities, k=k, dim=1)
+
+
+@lru_cache(maxsize=None)
+def _score_topk_compiled():
+    """torch.compile'd _score_topk_eager, built on first use so importing this
+    module doesn't pull in dynamo; dynamic so batch size and k don't recompile"""
+    return torch.compile(_score_topk_eager, dynamic=True)
 
 
 class SkillNormalizer:
@@ -24,7 +93,10 @@ class SkillNormalizer:
     def __init__(
         self, 
         skill_taxonomy_path: str = "datasets/skill_taxonomy.csv",
-        model_name: str = "all-MiniLM-L6-v2"  # Smaller, faster model (80MB vs 400MB)
+        model_name: str = "all-MiniLM-L6-v2",  # Smaller, faster model (80MB vs 400MB)
+        backend: str = "onnx",
+        num_threads: Optional[int] = None,
+        compile_scoring: bool = False
     ):
         """
         Initialize skill normalizer
@@ -32,15 +104,85 @@ class SkillNormalizer:
         Args:
             skill_taxonomy_path: Path to standard skill taxonomy
             model_name: Sentence-BERT model name (multilingual)
+            backend: 'onnx' (INT8 ONNX on CPU, PyTorch on CUDA), 'torch',
+                or 'model2vec' (static embeddings, CPU only, much faster)
+            num_threads: onnxruntime intra-op threads (default: all cores)
+            compile_scoring: torch.compile the top-k scoring; compiled while
+                loading the taxonomy (adds seconds to startup, not to requests)
         """
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        if backend == "model2vec" and not MODEL2VEC_AVAILABLE:
+            print("Warning: model2vec not installed, using Sentence-BERT")
+            print("Install with: pip install model2vec")
+            backend = "onnx"
+        self.backend = backend
+        self._num_threads = num_threads or os.cpu_count() or 1
+        self._model_id = MODEL2VEC_MODEL if backend == "model2vec" else model_name
+        
+        self.device = "cuda" if torch.cuda.is_available() and backend != "model2vec" else "cpu"
         print(f"Using device: {self.device}")
         
-        # Load Sentence-BERT model
-        print(f"Loading {model_name}...")
-        self.model = SentenceTransformer(model_name, device=self.device)
+        # Load embedding model
+        self.model = None
+        self._ort = None
+        if backend == "model2vec":
+            print(f"Loading {MODEL2VEC_MODEL}...")
+            self.model = StaticModel.from_pretrained(MODEL2VEC_MODEL)
+        else:
+            print(f"Loading {model_name}...")
+        if backend == "onnx" and self.device == "cpu":
+            try:
+                self.model = self._load_onnx_int8(model_name)
+            except Exception as e:
+                print(f"Warning: INT8 ONNX backend unavailable ({e}), using PyTorch")
+        if self.model is not None and backend == "onnx" and ORT_AVAILABLE:
+            try:
+                self._init_ort_session(_onnx_export_dir(model_name))
+            except Exception as e:
+                print(f"Warning: IOBinding encode path unavailable ({e})")
+                self._ort = None
+        if self.model is None:
+            self.model = SentenceTransformer(model_name, device=self.device)
+        
+        # FP16 weights on GPU; embeddings inherit the model dtype
+        if self.device == "cuda":
+            self.model = self.model.half()
+        self.dtype = torch.float16 if self.device == "cuda" else torch.float32
+        self._encode_batch = 128 if self.device == "cuda" else 32
+        
+        # BF16 autocast for the PyTorch backend on CPUs with native BF16
+        self.use_bf16_autocast = (
+            self.device == "cpu"
+            and backend != "model2vec"
+            and getattr(self.model, "backend", "torch") == "torch"
+            and getattr(torch.cpu, "_is_avx512_bf16_supported", lambda: False)()
+        )
+        
+        # The encoder that will actually produce the vectors (after any
+        # fallback), so caches from different encoders never mix
+        if backend == "model2vec":
+            self._encoder_tag = "model2vec"
+        elif getattr(self.model, "backend", "torch") == "onnx":
+            self._encoder_tag = "onnx-int8"
+        elif self.device == "cuda":
+            self._encoder_tag = "torch-fp16"
+        else:
+            self._encoder_tag = "torch-bf16" if self.use_bf16_autocast else "torch-fp32"
+        
+        # Opt-in; falls back to eager scoring if torch.compile fails here
+        self._use_compiled_scoring = compile_scoring
+        
+        # Approximate-search index, built only for large taxonomies
+        self._index = None
+        
+        # LRU cache of normalize results: (key, threshold, top_k) -> matches
+        self._cache: OrderedDict = OrderedDict()
+        
+        # One normalizer may be shared across threads: the LRU cache and the
+        # reused IOBinding buffers must not be touched by two calls at once
+        self._lock = threading.RLock()
         
         # Load skill taxonomy
+        self._taxonomy_path = skill_taxonomy_path
         self.skill_taxonomy = self._load_taxonomy(skill_taxonomy_path)
         
         # Create embeddings for standard skills
@@ -49,15 +191,189 @@ class SkillNormalizer:
         
         print("✓ Skill Normalizer initialized")
     
+    def _load_onnx_int8(self, model_name: str) -> SentenceTransformer:
+        """Load the model as dynamically INT8-quantized ONNX, exporting it on first run"""
+        export_dir = _onnx_export_dir(model_name)
+        
+        if not (export_dir / ONNX_INT8_FILE).exists():
+            print("Exporting INT8 ONNX model (first run only)...")
+            onnx_model = SentenceTransformer(model_name, backend="onnx", device="cpu")
+            onnx_model.save_pretrained(str(export_dir))
+            export_dynamic_quantized_onnx_model(
+                onnx_model,
+                quantization_config="avx512_vnni",
+                model_name_or_path=str(export_dir)
+            )
+        
+        return SentenceTransformer(
+            str(export_dir),
+            backend="onnx",
+            device="cpu",
+            model_kwargs={"file_name": ONNX_INT8_FILE}
+        )
+    
+    def _init_ort_session(self, model_dir: Path):
+        """
+        Open the INT8 ONNX model directly in onnxruntime
+        
+        Encoding then bypasses SentenceTransformer.encode: inputs are
+        tokenized into preallocated buffers and run with IOBinding, so
+        repeated calls reuse the same input/output memory.
+        
+        Args:
+            model_dir: Export folder written by _load_onnx_int8
+        """
+        opts = ort.SessionOptions()
+        opts.intra_op_num_threads = self._num_threads
+        self._ort = ort.InferenceSession(
+            str(model_dir / ONNX_INT8_FILE),
+            sess_options=opts,
+            providers=["CPUExecutionProvider"]
+        )
+        self._ort_tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+        self._ort_inputs = [i.name for i in self._ort.get_inputs()]
+        output_names = [o.name for o in self._ort.get_outputs()]
+        self._ort_output = (
+            "last_hidden_state" if "last_hidden_state" in output_names else output_names[0]
+        )
+        self._ort_dim = self.model.get_sentence_embedding_dimension()
+        # Same truncation as SentenceTransformer.encode (256 for MiniLM)
+        self._ort_max_length = self.model.max_seq_length
+        # (batch size, seq_len) -> (input buffers, output buffer, IOBinding)
+        self._ort_buffers: Dict[Tuple[int, int], Tuple[Dict[str, np.ndarray], np.ndarray, object]] = {}
+    
+    def _ort_binding(self, n: int, seq_len: int) -> Tuple[Dict[str, np.ndarray], np.ndarray, object]:
+        """Reusable buffers and IOBinding for a batch of n texts padded to seq_len"""
+        key = (n, seq_len)
+        if key not in self._ort_buffers:
+            if len(self._ort_buffers) >= ORT_BINDING_CACHE_SIZE:
+                # Drop the oldest shape
+                del self._ort_buffers[next(iter(self._ort_buffers))]
+            inputs = {
+                name: np.zeros((n, seq_len), dtype=np.int64)
+                for name in self._ort_inputs
+            }
+            output = np.empty((n, seq_len, self._ort_dim), dtype=np.float32)
+            
+            binding = self._ort.io_binding()
+            for name, buf in inputs.items():
+                binding.bind_cpu_input(name, buf)
+            binding.bind_ortvalue_output(
+                self._ort_output, ort.OrtValue.ortvalue_from_numpy(output)
+            )
+            self._ort_buffers[key] = (inputs, output, binding)
+        
+        return self._ort_buffers[key]
+    
+    def _encode_ort(self, texts: List[str]) -> torch.Tensor:
+        """Mean-pooled, unit-norm embeddings via onnxruntime IOBinding"""
+        with self._lock:
+            return self._encode_ort_locked(texts)
+    
+    def _encode_ort_locked(self, texts: List[str]) -> torch.Tensor:
+        """_encode_ort body; the bound buffers are shared, so callers hold self._lock"""
+        if not texts:
+            return torch.empty((0, self._ort_dim))
+        
+        # Batch texts of similar length together (as SentenceTransformer.encode
+        # does), so padding to each batch's longest text adds little
+        order = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+        chunks = []
+        for start in range(0, len(texts), self._encode_batch):
+            batch = [texts[i] for i in order[start:start + self._encode_batch]]
+            
+            tokens = self._ort_tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=self._ort_max_length,
+                return_tensors="np"
+            )
+            inputs, output, binding = self._ort_binding(len(batch), tokens['input_ids'].shape[1])
+            for name, buf in inputs.items():
+                if name in tokens:
+                    np.copyto(buf, tokens[name])
+                else:
+                    buf.fill(0)
+            
+            self._ort.run_with_iobinding(binding)
+            
+            # Mean-pool over real tokens (output buffer is reused next call)
+            mask = inputs['attention_mask'][..., None].astype(np.float32)
+            pooled = (output * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+            chunks.append(pooled)
+        
+        # Back to input order
+        embeddings = np.empty((len(texts), self._ort_dim), dtype=np.float32)
+        embeddings[order] = np.concatenate(chunks)
+        return torch.nn.functional.normalize(torch.from_numpy(embeddings), dim=1)
+    
     def _load_taxonomy(self, path: str) -> pd.DataFrame:
         """Load skill taxonomy"""
         if Path(path).exists():
-            df = pd.read_csv(path)
+            df = load_skill_taxonomy(path)
             print(f"Loaded {len(df)} standard skills")
-            return df
         else:
             print(f"Warning: Taxonomy not found at {path}")
-            return pd.DataFrame()
+            df = pd.DataFrame(columns=['skill_id', 'skill_name', 'category'])
+        
+        self._set_taxonomy_arrays(df)
+        return df
+    
+    def _autocast(self):
+        """Autocast context for encode calls (BF16 on capable CPUs, else no-op)"""
+        if self.use_bf16_autocast:
+            return torch.autocast("cpu", dtype=torch.bfloat16)
+        return nullcontext()
+    
+    def _encode(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        show_progress_bar: bool = False
+    ) -> torch.Tensor:
+        """
+        Encode texts to unit-norm embeddings on self.device in self.dtype
+        
+        Args:
+            texts: Texts to encode
+            batch_size: Encode batch size (default: 128 on CUDA, 32 on CPU)
+            show_progress_bar: Show a progress bar while encoding
+            
+        Returns:
+            (len(texts), dim) embedding tensor
+        """
+        if self.backend == "model2vec":
+            # numpy float32 out of StaticModel; from_numpy shares the buffer
+            embeddings = torch.from_numpy(
+                self.model.encode(texts, show_progress_bar=show_progress_bar)
+            )
+            return torch.nn.functional.normalize(embeddings, dim=1)
+        
+        if self._ort is not None:
+            return self._encode_ort(texts)
+        
+        # No manual length sorting needed: SentenceTransformer.encode already
+        # orders inputs by length before batching (less padding per batch)
+        # and returns embeddings in input order.
+        with self._autocast():
+            embeddings = self.model.encode(
+                texts,
+                batch_size=batch_size or self._encode_batch,
+                convert_to_tensor=True,
+                normalize_embeddings=True,
+                show_progress_bar=show_progress_bar
+            )
+        return embeddings.to(self.dtype)
+    
+    def _set_taxonomy_arrays(self, df: pd.DataFrame):
+        """Keep taxonomy columns as parallel numpy arrays for hot-path lookups"""
+        self._skill_names = df['skill_name'].to_numpy(dtype=object)
+        self._categories = df['category'].to_numpy(dtype=object)
+        self._skill_ids = df['skill_id'].to_numpy(dtype=object)
+        self._name_to_row = {
+            name.lower(): i for i, name in enumerate(self._skill_names.tolist())
+        }
     
     def _create_skill_embeddings(self):
         """Create embeddings for all standard skills"""
@@ -66,15 +382,90 @@ class SkillNormalizer:
         # Get all skill names
         skill_names = self.skill_taxonomy['skill_name'].tolist()
         
-        # Generate embeddings
-        self.skill_embeddings = self.model.encode(
-            skill_names,
-            convert_to_tensor=True,
-            show_progress_bar=True
-        )
+        cache_path = self._embedding_cache_path()
+        cached = self._load_embedding_cache(cache_path, len(skill_names))
+        if cached is not None:
+            print(f"✓ Loaded cached embeddings from {cache_path}")
+            # Saved unit-norm; on CPU float32 this keeps the memory map
+            self.skill_embeddings = cached.to(self.device, self.dtype)
+        else:
+            # Generate embeddings
+            self.skill_embeddings = self._encode(
+                skill_names,
+                show_progress_bar=sys.stderr.isatty()
+            )
+            # Unit rows once here, so each query is a plain dot product
+            self.skill_embeddings = torch.nn.functional.normalize(self.skill_embeddings, dim=1)
+            self._save_embedding_cache(cache_path)
+        
+        self._cache.clear()
+        self._build_index()
+        self._compile_scoring()
         
         print(f"✓ Created embeddings for {len(skill_names)} skills")
     
+    def _compile_scoring(self):
+        """Compile the top-k scoring now, on a dummy batch, instead of in the first request"""
+        if not self._use_compiled_scoring:
+            return
+        queries = self.skill_embeddings[:2]
+        try:
+            _score_topk_compiled()(queries, self.skill_embeddings, min(3, len(self.skill_embeddings)))
+        except (ImportError, RuntimeError) as e:
+            # Dynamo/Inductor failures (no C++ compiler, unsupported backend)
+            print(f"Warning: torch.compile unavailable ({e}), scoring eagerly")
+            self._use_compiled_scoring = False
+    
+    def _embedding_cache_path(self) -> Path:
+        """On-disk float32 cache of the taxonomy embeddings for this model/encoder"""
+        taxonomy_path = Path(self._taxonomy_path)
+        tag = f"{self._model_id}-{self._encoder_tag}".replace('/', '__')
+        return taxonomy_path.with_name(f"{taxonomy_path.stem}_emb.{tag}.f32.npy")
+    
+    def _load_embedding_cache(self, cache_path: Path, n_skills: int) -> Optional[torch.Tensor]:
+        """Memory-map the cached embeddings if they are newer than the taxonomy"""
+        taxonomy_path = Path(self._taxonomy_path)
+        if not cache_path.exists() or cache_path.stat().st_mtime < taxonomy_path.stat().st_mtime:
+            return None
+        
+        # Copy-on-write map: the tensor shares the file's pages, nothing is
+        # read into RAM up front and the cache file is never modified
+        try:
+            embeddings = np.load(cache_path, mmap_mode='c')
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring embedding cache {cache_path}: {e}")
+            return None
+        if embeddings.shape[0] != n_skills or embeddings.dtype != np.float32:
+            return None
+        return torch.from_numpy(embeddings)
+    
+    def _save_embedding_cache(self, cache_path: Path):
+        """
+        Write the unit-norm taxonomy embeddings as float32 .npy (exact, no rounding)
+        
+        Written to a temp file and moved into place with os.replace, so a
+        process loading the cache never maps a partially written file.
+        """
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.save(f, self.skill_embeddings.float().cpu().numpy())
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not cache embeddings: {e}")
+    
+    def _build_index(self):
+        """Build a FAISS HNSW inner-product index for large taxonomies"""
+        self._index = None
+        if not FAISS_AVAILABLE or len(self.skill_embeddings) < FAISS_MIN_SKILLS:
+            return
+        
+        emb_np = self.skill_embeddings.float().cpu().numpy()
+        self._index = faiss.IndexHNSWFlat(emb_np.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+        self._index.hnsw.efConstruction = 64
+        self._index.add(emb_np)
+        print(f"✓ Built HNSW index over {len(emb_np)} skills")
+    
     def normalize_skill(
         self, 
         skill_text: str, 
@@ -95,30 +486,91 @@ class SkillNormalizer:
         if self.skill_taxonomy.empty:
             return []
         
-        # Create embedding for input skill
-        skill_embedding = self.model.encode(skill_text, convert_to_tensor=True)
+        return self._normalize_cached([skill_text], threshold, top_k)[0]
+    
+    def _normalize_skill_uncached(
+        self,
+        keys: List[str],
+        threshold: float,
+        top_k: int
+    ) -> List[List[Dict]]:
+        """Run the model for cache keys that have not been seen yet"""
+        return self._match_skills(keys, threshold, top_k)
+    
+    def _normalize_cached(
+        self,
+        skill_texts: List[str],
+        threshold: float,
+        top_k: int
+    ) -> List[List[Dict]]:
+        """
+        Normalize skills through the LRU cache
+        
+        Keys are `skill_text.strip().lower()` (the model is uncased), so
+        "Fan Fixing " and "fan fixing" share one entry. Only cache misses
+        are encoded, in a single batch.
         
-        # Calculate cosine similarity with all standard skills
-        similarities = util.cos_sim(skill_embedding, self.skill_embeddings)[0]
+        Args:
+            skill_texts: Raw skill texts to normalize
+            threshold: Minimum similarity threshold (0-1)
+            top_k: Number of top matches per skill
+            
+        Returns:
+            One list of matches per input skill, in input order
+        """
+        keys = [(text.strip().lower(), threshold, top_k) for text in skill_texts]
         
-        # Get top k matches
-        top_results = torch.topk(similarities, k=min(top_k, len(similarities)))
+        with self._lock:
+            found = self._lookup_or_compute(keys, threshold, top_k)
         
-        matches = []
-        for score, idx in zip(top_results.values, top_results.indices):
-            score_val = score.item()
+        # Copy so callers never mutate cached entries
+        return [
+            [dict(match, original_skill=text) for match in found[key]]
+            for text, key in zip(skill_texts, keys)
+        ]
+    
+    def _lookup_or_compute(self, keys: List[Tuple], threshold: float, top_k: int) -> Dict:
+        """Cached matches for keys, computing misses in one batch (caller holds self._lock)"""
+        found = {}
+        for key in keys:
+            if key in self._cache:
+                found[key] = self._cache[key]
+                self._cache.move_to_end(key)
+        
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing:
+            computed = self._normalize_skill_uncached(
+                [key[0] for key in missing], threshold, top_k
+            )
+            for key, matches in zip(missing, computed):
+                found[key] = matches
+                self._cache[key] = matches
+            while len(self._cache) > NORMALIZE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        
+        return found
+    
+    def normalize_skills_batch(
+        self,
+        skills: List[str],
+        threshold: float = 0.5,
+        top_k: int = 3
+    ) -> List[List[Dict]]:
+        """
+        Normalize many skills with one encode call and one similarity matmul
+        
+        Args:
+            skills: Raw skill texts to normalize
+            threshold: Minimum similarity threshold (0-1)
+            top_k: Number of top matches per skill
             
-            if score_val >= threshold:
-                skill_row = self.skill_taxonomy.iloc[idx.item()]
-                matches.append({
-                    'original_skill': skill_text,
-                    'normalized_skill': skill_row['skill_name'],
-                    'category': skill_row['category'],
-                    'similarity': round(score_val, 3),
-                    'skill_id': skill_row['skill_id']
-                })
+        Returns:
+            One list of matches per input skill, in input order
+        """
+        if self.skill_taxonomy.empty or not skills:
+            return [[] for _ in skills]
         
-        return matches
+        return self._normalize_cached(skills, threshold, top_k)
     
     def normalize_skill_list(
         self, 
@@ -135,15 +587,97 @@ class SkillNormalizer:
         Returns:
             List of normalized skills (best match for each)
         """
+        if self.skill_taxonomy.empty or not skills:
+            return []
+        
         normalized = []
         
-        for skill in skills:
-            matches = self.normalize_skill(skill, threshold=threshold, top_k=1)
+        for matches in self._normalize_cached(skills, threshold, top_k=1):
             if matches:
                 normalized.append(matches[0])
         
         return normalized
     
+    def _match_skills(
+        self,
+        skill_texts: List[str],
+        threshold: float,
+        top_k: int,
+        skill_embeddings: Optional[torch.Tensor] = None
+    ) -> List[List[Dict]]:
+        """
+        Match a batch of raw skills against the taxonomy
+        
+        All inputs are encoded in one call and scored with a single matmul
+        against the unit-norm taxonomy embeddings (cosine similarity).
+        
+        Args:
+            skill_texts: Raw skill texts to normalize
+            threshold: Minimum similarity threshold (0-1)
+            top_k: Number of top matches per skill
+            skill_embeddings: Precomputed unit-norm embeddings for
+                skill_texts (skips encoding)
+            
+        Returns:
+            One list of matches per input skill, in input order
+        """
+        # Create embeddings for input skills
+        if skill_embeddings is None:
+            skill_embeddings = self._encode(skill_texts)
+        
+        k = min(top_k, len(self.skill_embeddings))
+        
+        if self._index is not None:
+            # Approximate search; missing hits come back as id -1 with a
+            # -inf-like score, so the threshold below drops them
+            scores, indices = self._index.search(
+                skill_embeddings.float().cpu().numpy(), k
+            )
+            scores, indices = torch.from_numpy(scores), torch.from_numpy(indices)
+        else:
+            # Cosine similarity with all standard skills + top k, as one
+            # compiled graph
+            scores, indices = self._score_topk(skill_embeddings, k)
+        # topk is sorted, so the matches above threshold are a prefix of each row
+        scores = scores.float()
+        counts = (scores >= threshold).sum(dim=1)
+        scores = torch.round(scores, decimals=3)
+        
+        # One device->host copy per tensor, no per-candidate .item() syncs
+        scores_list = scores.cpu().tolist()
+        counts_list = counts.cpu().tolist()
+        idx_np = indices.cpu().numpy()
+        
+        # Gather taxonomy fields for every hit at once from the SoA arrays
+        names = self._skill_names[idx_np].tolist()
+        categories = self._categories[idx_np].tolist()
+        skill_ids = self._skill_ids[idx_np].tolist()
+        
+        results = []
+        for i, skill_text in enumerate(skill_texts):
+            results.append([
+                {
+                    'original_skill': skill_text,
+                    'normalized_skill': names[i][j],
+                    'category': categories[i][j],
+                    'similarity': scores_list[i][j],
+                    'skill_id': skill_ids[i][j]
+                }
+                for j in range(counts_list[i])
+            ])
+        
+        return results
+    
+    def _score_topk(
+        self,
+        skill_embeddings: torch.Tensor,
+        k: int
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Brute-force top-k against the taxonomy, compiled if compile_scoring is on"""
+        if self._use_compiled_scoring:
+            return _score_topk_compiled()(skill_embeddings, self.skill_embeddings, k)
+        return _score_topk_eager(skill_embeddings, self.skill_embeddings, k)
+    
     def find_similar_skills(
         self, 
         skill_text: str, 
@@ -159,34 +693,102 @@ class SkillNormalizer:
         Returns:
             List of similar skills
         """
-        return self.normalize_skill(skill_text, threshold=0.3, top_k=top_k)
+        if self.skill_taxonomy.empty:
+            return []
+        
+        # Known taxonomy entries already have an embedding; skip the encoder
+        row = self._name_to_row.get(skill_text.strip().lower())
+        if row is None:
+            return self.normalize_skill(skill_text, threshold=0.3, top_k=top_k)
+        
+        return self._match_skills(
+            [skill_text],
+            threshold=0.3,
+            top_k=top_k,
+            skill_embeddings=self.skill_embeddings[row:row + 1]
+        )[0]
     
     def save_embeddings(self, filepath: str):
-        """Save embeddings to disk"""
-        data = {
-            'embeddings': self.skill_embeddings.cpu().numpy(),
-            'taxonomy': self.skill_taxonomy.to_dict()
-        }
+        """
+        Save embeddings to disk
+        
+        Writes the embedding matrix as safetensors at `filepath`, plus
+        sibling files for the taxonomy (.parquet, or .csv without pyarrow),
+        the normalize cache (.cache.json) and the HNSW index (.faiss) if
+        one was built.
+        
+        Args:
+            filepath: Path of the .safetensors file
+        """
+        path = Path(filepath)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        save_file({"emb": self.skill_embeddings.contiguous().cpu()}, str(path))
+        
+        if PYARROW_AVAILABLE:
+            self.skill_taxonomy.to_parquet(path.with_suffix('.parquet'), index=False)
+        else:
+            self.skill_taxonomy.to_csv(path.with_suffix('.csv'), index=False)
+        
+        if self._index is not None:
+            faiss.write_index(self._index, str(path.with_suffix('.faiss')))
         
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'wb') as f:
-            pickle.dump(data, f)
+        with self._lock:
+            cache_entries = [list(key) + [matches] for key, matches in self._cache.items()]
+        with open(path.with_suffix('.cache.json'), 'w', encoding='utf-8') as f:
+            json.dump(cache_entries, f, ensure_ascii=False)
         
         print(f"✓ Saved embeddings to {filepath}")
     
     def load_embeddings(self, filepath: str):
-        """Load pre-computed embeddings"""
-        with open(filepath, 'rb') as f:
-            data = pickle.load(f)
+        """
+        Load pre-computed embeddings
+        
+        The safetensors file is memory-mapped and read straight onto
+        self.device; saved embeddings are already unit-norm.
+        
+        Args:
+            filepath: Path of the .safetensors file written by save_embeddings
+        """
+        path = Path(filepath)
+        
+        with safe_open(str(path), framework="pt", device=self.device) as f:
+            self.skill_embeddings = f.get_tensor("emb").to(self.dtype)
+        
+        parquet_path = path.with_suffix('.parquet')
+        if parquet_path.exists():
+            self.skill_taxonomy = pd.read_parquet(parquet_path)
+        else:
+            self.skill_taxonomy = pd.read_csv(path.with_suffix('.csv'))
+        self._set_taxonomy_arrays(self.skill_taxonomy)
+        
+        index_path = path.with_suffix('.faiss')
+        if FAISS_AVAILABLE and index_path.exists():
+            self._index = faiss.read_index(str(index_path))
+        else:
+            self._build_index()
         
-        self.skill_embeddings = torch.tensor(data['embeddings']).to(self.device)
-        self.skill_taxonomy = pd.DataFrame(data['taxonomy'])
+        self._cache = OrderedDict()
+        cache_path = path.with_suffix('.cache.json')
+        if cache_path.exists():
+            with open(cache_path, encoding='utf-8') as f:
+                for key_text, threshold, top_k, matches in json.load(f):
+                    self._cache[(key_text, threshold, top_k)] = matches
         
         print(f"✓ Loaded embeddings from {filepath}")
 
-
 def main():
     """Demo and testing"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Skill Normalization Demo')
+    parser.add_argument('--save-embeddings', type=str, metavar='PATH',
+                        help='Save embeddings to PATH (.safetensors) if stale')
+    parser.add_argument('--force-rebuild', action='store_true',
+                        help='Save embeddings even if PATH is newer than the taxonomy')
+    
+    args = parser.parse_args()
+    
     print("=" * 70)
     print("Skill Normalization Module - Demo")
     print("=" * 70)
@@ -230,9 +832,20 @@ def main():
     for i, skill in enumerate(similar, 1):
         print(f"  {i}. {skill['normalized_skill']} - {skill['similarity']:.2%}")
     
-    # Save embeddings for future use
-    print("\n\n=== Saving Embeddings ===")
-    normalizer.save_embeddings("models/skill_embeddings.pkl")
+    # Save embeddings for future use (only on request, and only if stale)
+    if args.save_embeddings:
+        print("\n\n=== Saving Embeddings ===")
+        save_path = Path(args.save_embeddings)
+        taxonomy_path = Path(normalizer._taxonomy_path)
+        up_to_date = (
+            save_path.exists()
+            and taxonomy_path.exists()
+            and save_path.stat().st_mtime > taxonomy_path.stat().st_mtime
+        )
+        if up_to_date and not args.force_rebuild:
+            print("✓ Cached embeddings up to date")
+        else:
+            normalizer.save_embeddings(str(save_path))
     
     print("\n" + "=" * 70)
     print("✓ Skill Normalization Demo Complete")
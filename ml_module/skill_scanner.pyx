@@ -0,0 +1,44 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled keyword trie walk for MultilingualSkillExtractor
+
+Optional: skill_extraction_multilingual falls back to its pure Python walk
+when this module has not been built. Build in place with:
+
+    cythonize -3 -i skill_scanner.pyx
+"""
+
+
+cpdef list scan(dict trie, str text):
+    """
+    Find every keyword occurrence in text
+
+    Args:
+        trie: Keyword trie from skill_extraction_multilingual._build_trie
+        text: Lowercased text
+
+    Returns:
+        List of (end index, keyword ids), the same items that
+        skill_extraction_multilingual._trie_iter yields
+    """
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t n = len(text)
+    cdef dict node
+    cdef object child, value
+    cdef list hits = []
+
+    for i in range(n):
+        # Most offsets fail here: the character starts no keyword
+        child = trie.get(text[i])
+        j = i + 1
+        while child is not None:
+            node = <dict>child
+            value = node.get('')
+            if value is not None:
+                hits.append((j - 1, value))
+            if j == n:
+                break
+            child = node.get(text[j])
+            j += 1
+
+    return hits
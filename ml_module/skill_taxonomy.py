@@ -0,0 +1,57 @@
+"""
+Skill Taxonomy Loader
+Shared, cached access to datasets/skill_taxonomy.csv
+
+The CSV is parsed once with pyarrow's multithreaded CSV reader and written to
+a Parquet file next to it; later process starts read the Parquet copy.
+Within a process, the loaded DataFrame is shared by every caller, so treat
+it as read-only.
+"""
+
+import pandas as pd
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
+try:
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def load_skill_taxonomy(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Load the skill taxonomy, using the Parquet cache when it is up to date
+
+    Args:
+        path: Path to skill taxonomy CSV
+
+    Returns:
+        Skill taxonomy DataFrame (shared between callers, do not modify)
+    """
+    csv_path = Path(path).resolve()
+    return _load_cached(str(csv_path), csv_path.stat().st_mtime)
+
+
+@lru_cache(maxsize=4)
+def _load_cached(csv_path: str, mtime: float) -> pd.DataFrame:
+    """Load a taxonomy file; `mtime` is part of the key so edits invalidate it"""
+    csv_path = Path(csv_path)
+
+    if not PYARROW_AVAILABLE:
+        return pd.read_csv(csv_path)
+
+    parquet_path = csv_path.with_suffix('.parquet')
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= mtime:
+        return pq.read_table(parquet_path).to_pandas(types_mapper=pd.ArrowDtype)
+
+    # Parse straight into Arrow columns; same dtypes as the cached path
+    table = pacsv.read_csv(csv_path)
+    try:
+        pq.write_table(table, parquet_path)
+    except OSError as e:
+        print(f"Warning: Could not cache taxonomy as Parquet: {e}")
+
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
@@ -3,10 +3,13 @@ Voice Input Accuracy Testing - Multilingual
 Test real audio files across English, Hindi, Tamil, Telugu, Kannada
 """
 
+import os
 import sys
 from pathlib import Path
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from typing import Optional
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -140,8 +143,14 @@ VOICE_TEST_CASES = [
 ]
 
 
-def test_voice_pipeline():
-    """Test complete voice-to-profile pipeline"""
+def test_voice_pipeline(cpu_threads: Optional[int] = None):
+    """
+    Test complete voice-to-profile pipeline
+    
+    Args:
+        cpu_threads: Thread budget for Whisper and the ONNX encoder
+            (default: all cores; set per worker in parallel runs)
+    """
     print("\n" + "="*70)
     print("🎙️ Voice Accuracy Testing - Multilingual")
     print("="*70)
@@ -150,14 +159,23 @@ def test_voice_pipeline():
         from ml_pipeline import SkillSyncPipeline
         
         print("\n✓ Initializing Voice-First Pipeline...")
-        pipeline = SkillSyncPipeline(use_whisper=True)
+        if cpu_threads:
+            from audio_processor import AudioProcessor
+            from skill_normalization import SkillNormalizer
+            pipeline = SkillSyncPipeline(
+                use_whisper=True,
+                audio_processor=AudioProcessor(model_size="base", cpu_threads=cpu_threads),
+                normalizer=SkillNormalizer(num_threads=cpu_threads)
+            )
+        else:
+            pipeline = SkillSyncPipeline(use_whisper=True)
         
         return pipeline
     
     except Exception as e:
         print(f"\n✗ Failed to initialize pipeline: {e}")
         print("\nMake sure Whisper is installed:")
-        print("  pip install openai-whisper ffmpeg-python pydub")
+        print("  pip install faster-whisper ffmpeg-python pydub")
         return None
 
 
@@ -166,13 +184,16 @@ def calculate_skill_accuracy(extracted: list, expected: list) -> float:
     if not expected:
         return 0.0
     
-    # Count matches (case-insensitive, partial matching)
+    # Lowercase once up front (case-insensitive, partial matching)
+    exp = [s.lower() for s in expected]
+    ext = [s.lower() for s in extracted]
+    ext_set = set(ext)
+    
+    # Exact hits are a set lookup; only the rest need substring checks
     matches = 0
-    for exp_skill in expected:
-        for ext_skill in extracted:
-            if exp_skill.lower() in ext_skill.lower() or ext_skill.lower() in exp_skill.lower():
-                matches += 1
-                break
+    for e in exp:
+        if e in ext_set or any(e in x or x in e for x in ext):
+            matches += 1
     
     accuracy = (matches / len(expected)) * 100
     return accuracy
@@ -283,20 +304,75 @@ def test_single_audio(pipeline, test_case: dict) -> dict:
         }
 
 
-def run_all_tests():
-    """Run all voice accuracy tests"""
-    # Initialize pipeline
-    pipeline = test_voice_pipeline()
+# Each worker loads its own Whisper + encoder, so keep the pool small
+MAX_WORKERS = 4
+
+# Per-process state for parallel runs; the pipeline is built on the first
+# audio file found, and a failed build is not retried
+_worker_state = {'cpu_threads': None, 'pipeline': None, 'init_failed': False}
+
+
+def _init_worker(cpu_threads: int):
+    """Process-pool initializer: give this worker its share of the cores"""
+    _worker_state['cpu_threads'] = cpu_threads
+    try:
+        import torch
+        torch.set_num_threads(cpu_threads)
+    except ImportError:
+        pass
+
+
+def _run_test_case(test_case: dict) -> dict:
+    """Process-pool worker: test one case with this process's pipeline"""
+    if (
+        _worker_state['pipeline'] is None
+        and not _worker_state['init_failed']
+        and Path(test_case['audio_file']).exists()
+    ):
+        _worker_state['pipeline'] = test_voice_pipeline(_worker_state['cpu_threads'])
+        _worker_state['init_failed'] = _worker_state['pipeline'] is None
     
-    if not pipeline:
-        return
+    if _worker_state['init_failed'] and Path(test_case['audio_file']).exists():
+        return {
+            'test_id': test_case['id'],
+            'language': test_case['language'],
+            'status': 'error',
+            'error': 'pipeline initialization failed'
+        }
+    return test_single_audio(_worker_state['pipeline'], test_case)
+
+
+def run_all_tests(serial: bool = False):
+    """
+    Run all voice accuracy tests
+    
+    Args:
+        serial: Run test cases one by one in this process (for debugging);
+            otherwise they run across a process pool, one pipeline per worker
+    """
+    if serial:
+        # Initialize pipeline
+        pipeline = test_voice_pipeline()
+        
+        if not pipeline:
+            return
+        
+        all_results = [test_single_audio(pipeline, tc) for tc in VOICE_TEST_CASES]
+    else:
+        cpu_count = os.cpu_count() or 1
+        max_workers = min(len(VOICE_TEST_CASES), cpu_count, MAX_WORKERS)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(max(1, cpu_count // max_workers),)
+        ) as ex:
+            all_results = list(ex.map(_run_test_case, VOICE_TEST_CASES))
     
-    # Run tests
+    # Aggregate results
     results = []
     languages = {}
     
-    for test_case in VOICE_TEST_CASES:
-        result = test_single_audio(pipeline, test_case)
+    for result in all_results:
         results.append(result)
         
         # Track by language
@@ -435,6 +511,7 @@ def main():
     parser = argparse.ArgumentParser(description='Voice Accuracy Testing')
     parser.add_argument('--create-samples', action='store_true', help='Show guide to create sample audio')
     parser.add_argument('--audio', type=str, help='Test single audio file')
+    parser.add_argument('--serial', action='store_true', help='Run tests one at a time (debugging)')
     
     args = parser.parse_args()
     
@@ -459,7 +536,7 @@ def main():
             print(f"\n✓ Test complete")
     else:
         # Run all tests
-        run_all_tests()
+        run_all_tests(serial=args.serial)
 
 
 if __name__ == "__main__":